@@ -0,0 +1,31 @@
+"""Compare attribute access throughput of typed accessor objects, config views and munch."""
+import os
+import sys
+import timeit
+
+import munch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+NUMBER = 1_000_000
+
+
+def main():
+    configaro.init('tests.config')
+    viewed = configaro.get('monitoring')
+    munched = munch.munchify(viewed._asdict())
+    typed = configaro.get_typed('monitoring')
+    cases = [
+        ('munch', lambda: munched.haproxy.disabled),
+        ('view', lambda: viewed.haproxy.disabled),
+        ('typed', lambda: typed.haproxy.disabled),
+    ]
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f'{name:>6}: {NUMBER / seconds / 1e6:6.2f}M reads/s')
+
+
+if __name__ == '__main__':
+    main()
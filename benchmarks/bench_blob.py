@@ -0,0 +1,65 @@
+"""Compare handing config data to child processes by blob, pickle and init."""
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import configaro  # noqa: E402
+
+TEAMS = 2000
+KNOBS = 50
+CHILD_INIT = '''
+import sys, time
+sys.path[:0] = [{root!r}, {directory!r}]
+start = time.perf_counter()
+import configaro
+configaro.init('bench_config')
+print(time.perf_counter() - start)
+'''
+
+
+def write_package(directory):
+    package_dir = os.path.join(directory, 'bench_config')
+    os.mkdir(package_dir)
+    open(os.path.join(package_dir, '__init__.py'), 'w').close()
+    data = {f'team_{i}': {'owner': f'owner_{i}', 'limits': {f'knob_{j}': j for j in range(KNOBS)}} for i in range(TEAMS)}
+    with open(os.path.join(package_dir, 'defaults.py'), 'w') as outfile:
+        outfile.write(f'config = {data!r}\n')
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    from munch import munchify
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_package(directory)
+        child = CHILD_INIT.format(root=ROOT, directory=directory)
+        output = subprocess.run([sys.executable, '-c', child], check=True, capture_output=True, text=True).stdout
+        print(f'init in child:  {float(output) * 1000:7.1f}ms')
+
+        sys.path.insert(0, directory)
+        config = configaro.Config()
+        config.init('bench_config')
+
+    munched = munchify(config.get()._data)
+    pickled, dumped = timed(pickle.dumps, munched, pickle.HIGHEST_PROTOCOL)
+    _, loaded = timed(pickle.loads, pickled)
+    print(f'pickled munch:  {loaded * 1000:7.1f}ms to load, {dumped * 1000:.1f}ms to dump, {len(pickled) / 2 ** 20:.2f}MB')
+
+    blob, exported = timed(config.export_blob)
+    _, adopted = timed(configaro.Config().adopt_blob, blob)
+    print(f'exported blob:  {adopted * 1000:7.1f}ms to adopt, {exported * 1000:.1f}ms to export, {len(blob) / 2 ** 20:.2f}MB')
+
+
+if __name__ == '__main__':
+    main()
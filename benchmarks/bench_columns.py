@@ -0,0 +1,39 @@
+"""Compare summing a field of list config records by row and by cached columns."""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+BACKENDS = 10000
+NUMBER = 100
+
+
+def main():
+    config = configaro.Config()
+    config.init('tests.config')
+    config.put({'backends': [{'host': f'backend-{i}', 'port': 8000 + i % 100, 'weight': i % 7 / 7}
+                             for i in range(BACKENDS)]})
+
+    def rows():
+        return sum(backend['weight'] for backend in config.get('backends'))
+
+    def columns():
+        return sum(config.get_columns('backends')['weight'])
+
+    timings = [('rows', rows), ('columns', columns)]
+    try:
+        import numpy  # noqa: F401
+
+        timings.append(('numpy', lambda: config.get_columns('backends', numpy=True)['weight'].sum()))
+    except ImportError:
+        pass
+    for name, func in timings:
+        elapsed = timeit.timeit(func, number=NUMBER) / NUMBER
+        print(f'{name:8} {elapsed * 1e6:9.1f}us per sum of {BACKENDS} weights')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Compare memory dirtied by forked children reading an unfrozen and a frozen config object."""
+import gc
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import configaro  # noqa: E402
+
+TEAMS = 5000
+KNOBS = 20
+CHILDREN = 4
+
+
+def write_package(directory):
+    package_dir = os.path.join(directory, 'bench_config')
+    os.mkdir(package_dir)
+    open(os.path.join(package_dir, '__init__.py'), 'w').close()
+    data = {f'team_{i}': {'owner': f'owner_{i % 10}', 'limits': {f'knob_{j}': j * 1.5 for j in range(KNOBS)}}
+            for i in range(TEAMS)}
+    with open(os.path.join(package_dir, 'defaults.py'), 'w') as outfile:
+        outfile.write(f'config = {data!r}\n')
+
+
+def private_dirty():
+    with open('/proc/self/smaps_rollup') as infile:
+        for line in infile:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+    raise RuntimeError('Private_Dirty not reported')
+
+
+def read_all():
+    total = 0.0
+    for i in range(TEAMS):
+        team = configaro.get(f'team_{i}')
+        total += sum(team.limits.values())
+    return total
+
+
+def fork_children():
+    growths = []
+    for _ in range(CHILDREN):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            before = private_dirty()
+            read_all()
+            gc.collect()
+            os.write(write_fd, str(private_dirty() - before).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as infile:
+            growths.append(int(infile.read()))
+        os.waitpid(pid, 0)
+    return sum(growths) / len(growths)
+
+
+def main():
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        sys.exit('requires Linux /proc/self/smaps_rollup')
+    with tempfile.TemporaryDirectory() as directory:
+        write_package(directory)
+        sys.path.insert(0, directory)
+        configaro.init('bench_config')
+    read_all()
+    print(f'unfrozen: {fork_children() / 1024:7.1f}MB dirtied per child')
+    configaro.freeze()
+    read_all()
+    print(f'frozen:   {fork_children() / 1024:7.1f}MB dirtied per child')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Compare serial and parallel loading and merging of config fragments."""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+FRAGMENTS = 500
+
+
+def write_fragments(directory):
+    for i in range(FRAGMENTS):
+        knobs = ',\n'.join(f'        "knob_{j}": {j}' for j in range(200))
+        with open(os.path.join(directory, f'{i:03d}-team.py'), 'w') as outfile:
+            outfile.write(f'config = {{\n    "team_{i}": {{\n{knobs}\n    }},\n    "shared": {{"owner": {i}}}\n}}\n')
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        write_fragments(directory)
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+        configs, serial = timed(configaro._load_fragments, paths, 1)
+        _, parallel = timed(configaro._load_fragments, paths, configaro.FRAGMENTS_LOAD_WORKERS)
+    print(f'load {FRAGMENTS} fragments: serial {serial * 1000:.1f}ms, parallel {parallel * 1000:.1f}ms')
+
+    def chain(configs):
+        data = {}
+        for config in configs:
+            data = dict(configaro._merge(data, config))
+        return data
+
+    _, linear = timed(chain, configs)
+    _, tree = timed(configaro._reduce, configs)
+    print(f'merge {FRAGMENTS} fragments: linear {linear * 1000:.1f}ms, tree {tree * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Measure put throughput with and without a group-committed override log."""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+PUTS = 20000
+
+
+def run(log_path=None):
+    config = configaro.Config()
+    config.init('tests.config', log_path=log_path)
+    fsyncs = 0
+    if log_path is not None:
+        fsync = os.fsync
+
+        def counted(fd):
+            nonlocal fsyncs
+            fsyncs += 1
+            fsync(fd)
+
+        os.fsync = counted
+    start = time.perf_counter()
+    for i in range(PUTS):
+        config.put(f'log.level=LEVEL_{i}')
+    elapsed = time.perf_counter() - start
+    if log_path is not None:
+        config._log.sync()
+        durable = time.perf_counter() - start
+        os.fsync = fsync
+        print(f'logged: {PUTS / elapsed:,.0f} puts/s, all durable after {durable * 1000:.0f}ms, '
+              f'{fsyncs} fsyncs ({PUTS / fsyncs:.0f} puts per fsync)')
+    else:
+        print(f'unlogged: {PUTS / elapsed:,.0f} puts/s')
+
+
+def main():
+    run()
+    with tempfile.TemporaryDirectory() as directory:
+        run(os.path.join(directory, 'overrides.log'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare applying 1000 command line overrides one put at a time and in a single put."""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+SECTIONS = 50
+KNOBS = 20
+REPEAT = 20
+
+
+def timed(func):
+    best = float('inf')
+    for _ in range(REPEAT):
+        config = configaro.Config()
+        config.init('tests.config')
+        config.put({f'section_{i}': {'limits': {f'knob_{j}': j for j in range(KNOBS)}} for i in range(SECTIONS)})
+        start = time.perf_counter()
+        func(config)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    argv = []
+    for i in range(SECTIONS):
+        for j in range(KNOBS):
+            argv.extend(['--set', f'section_{i}.limits.knob_{j}={j * 2}'])
+    parser = ArgumentParser()
+    configaro.add_put_argument(parser)
+    start = time.perf_counter()
+    updates = parser.parse_args(argv).set
+    parsed = time.perf_counter() - start
+
+    def each(config):
+        for update in updates:
+            config.put(update)
+
+    def batch(config):
+        config.put(*updates)
+
+    print(f'parse:    {parsed * 1000:6.2f}ms for {len(updates)} overrides')
+    print(f'each put: {timed(each) * 1000:6.2f}ms')
+    print(f'one put:  {timed(batch) * 1000:6.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Measure config client throughput against a config server on localhost."""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+SECONDS = 2.0
+KEYS = [f'section_{i}.knob_{j}' for i in range(10) for j in range(10)]
+
+
+def run_server(path, ready):
+    configaro.init('tests.config')
+    configaro.put({f'section_{i}': {f'knob_{j}': j for j in range(10)} for i in range(10)})
+    configaro.serve(path)
+    ready.set()
+    while True:
+        time.sleep(60)
+
+
+def throughput(func):
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.sock')
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=run_server, args=(path, ready), daemon=True)
+        server.start()
+        ready.wait()
+        try:
+            with configaro.ConfigClient(path, cache=False) as client:
+                single = throughput(lambda: client.get('section_3.knob_7'))
+                batched = throughput(lambda: client.get(*KEYS))
+            with configaro.ConfigClient(path) as client:
+                cached = throughput(lambda: client.get('section_3.knob_7'))
+        finally:
+            server.terminate()
+    print(f'uncached single key: {single:10.0f} requests/s')
+    print(f'uncached 100 keys:   {batched:10.0f} requests/s ({batched * len(KEYS):.0f} keys/s)')
+    print(f'cached single key:   {cached:10.0f} reads/s')
+
+
+if __name__ == '__main__':
+    main()
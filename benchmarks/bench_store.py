@@ -0,0 +1,62 @@
+"""Compare munchified config data with a memory mapped config store."""
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+ROUTES = 1000000
+LOOKUPS = 100000
+
+
+def routes():
+    return {'routes': {f'host_{i}': {'port': 8000 + i % 1000, 'weight': i % 7} for i in range(ROUTES // 2)}}
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def lookups(func):
+    start = time.perf_counter()
+    for i in range(0, LOOKUPS * 5, 5):
+        func(f'routes.host_{i}.port')
+    return (time.perf_counter() - start) / LOOKUPS * 1e6
+
+
+def main():
+    from munch import munchify
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'routes.cfgs')
+        # Compile in a child process, keeping the source data out of this one.
+        start = time.perf_counter()
+        process = multiprocessing.Process(target=lambda: configaro.compile_store(path, routes()))
+        process.start()
+        process.join()
+        compiled = time.perf_counter() - start
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'compile {ROUTES} values: {compiled:.2f}s, {size:.1f}MB')
+        rss = max_rss_mb()
+        store, opened = timed(configaro.ConfigStore, path)
+        print(f'open store: {opened * 1000:.2f}ms, {lookups(store.get):.2f}us/get, '
+              f'max rss +{max_rss_mb() - rss:.0f}MB')
+        store.close()
+        data, built = timed(lambda: munchify(routes()))
+        print(f'munchify: {built:.2f}s, {lookups(lambda name: configaro._get(data, name)):.2f}us/get, '
+              f'max rss +{max_rss_mb() - rss:.0f}MB')
+
+
+if __name__ == '__main__':
+    main()
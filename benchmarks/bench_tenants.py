@@ -0,0 +1,30 @@
+"""Measure memory used by config objects sharing a base config object."""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+TENANTS = 10_000
+
+
+def main():
+    base = configaro.Config()
+    base.init('tests.config')
+    base.put({f'section_{i}': {f'knob_{j}': j for j in range(100)} for i in range(100)})
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tenants = []
+    for i in range(TENANTS):
+        tenant = configaro.Config(base=base)
+        tenant.put(f'section_{i % 100}.knob_{i % 7}={i}')
+        tenants.append(tenant)
+    after = tracemalloc.get_traced_memory()[0]
+    print(f'{TENANTS} tenants over a 10k leaf base: {(after - before) / TENANTS:.0f} bytes/tenant')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Measure get() throughput scaling from 1 to 64 threads.
+
+Run with one or more interpreters to compare them, for example a standard
+and a free-threaded build::
+
+    python benchmarks/bench_threads.py python3.13 python3.13t
+
+Without arguments the current interpreter is measured.
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+SECONDS = 1.0
+THREADS = [1, 2, 4, 8, 16, 32, 64]
+QUERIES = ['log.level', 'monitoring.haproxy.disabled', 'flags.new_ui']
+
+
+def worker(start, deadline, counts, index):
+    # Count locally and publish once, so that threads share no counter.
+    get = configaro.get
+    count = 0
+    start.wait()
+    while time.perf_counter() < deadline[0]:
+        for prop_name in QUERIES:
+            get(prop_name, default=None)
+        count += len(QUERIES)
+    counts[index] = count
+
+
+def measure(threads):
+    start = threading.Event()
+    deadline = [0.0]
+    counts = [0] * threads
+    workers = [threading.Thread(target=worker, args=(start, deadline, counts, i)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    began = time.perf_counter()
+    deadline[0] = began + SECONDS
+    start.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - began)
+
+
+def main():
+    if len(sys.argv) > 1:
+        for python in sys.argv[1:]:
+            subprocess.run([python, __file__], check=True)
+        return
+    configaro.init('tests.config')
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    cores = os.cpu_count() or 1
+    print(f'{sys.version.split()[0]} GIL {"enabled" if gil else "disabled"}, {cores} cores')
+    baseline = None
+    for threads in THREADS:
+        throughput = measure(threads)
+        baseline = baseline or throughput
+        efficiency = throughput / (baseline * min(threads, cores))
+        print(f'{threads:3d} threads: {throughput / 1e6:6.2f}M gets/s, scaling efficiency {efficiency:6.1%}')
+
+
+if __name__ == '__main__':
+    main()
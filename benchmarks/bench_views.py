@@ -0,0 +1,48 @@
+"""Compare munchified copies of config data with zero-copy config views."""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import configaro  # noqa: E402
+
+TEAMS = 2000
+KNOBS = 100
+LOOKUPS = 100000
+
+
+def tree():
+    return {f'team_{i}': {'limits': {f'knob_{j}': j for j in range(KNOBS)}} for i in range(TEAMS)}
+
+
+def measured(func, data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def lookups(root):
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        root[f'team_{i % TEAMS}'].limits.knob_7
+    return (time.perf_counter() - start) / LOOKUPS * 1e6
+
+
+def main():
+    from munch import munchify
+
+    data = tree()
+    munched, elapsed, peak = measured(munchify, data)
+    print(f'munchify:   {elapsed * 1000:.1f}ms, {peak:.1f}MB allocated, {lookups(munched):.2f}us/attribute lookup')
+    view, elapsed, peak = measured(lambda data: configaro.ConfigView(configaro._Data(data)), data)
+    print(f'ConfigView: {elapsed * 1000:.3f}ms, {peak:.3f}MB allocated, {lookups(view):.2f}us/attribute lookup')
+
+
+if __name__ == '__main__':
+    main()
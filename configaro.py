@@ -1,33 +1,98 @@
 """Configaro Python configuration library."""
 
-import ast
-import os
-import sys
-from importlib import import_module
-from importlib.abc import FileLoader, SourceLoader
-from types import CodeType, ModuleType
-from typing import Any, List, Tuple, Union
+# Keep the imports made here cheap, as command line tools import configaro on
+# every invocation.  Heavier modules, such as json, are imported on first use
+# and modules only named in annotations are only imported by type checkers.
+from __future__ import annotations
 
-from munch import Munch, munchify
+import os
+import threading
+from contextvars import ContextVar
+from importlib.machinery import SourceFileLoader
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Tuple, Union
+from weakref import finalize, ref
+
+if TYPE_CHECKING:
+    from argparse import Action, ArgumentParser
+    from asyncio import Queue
+    from mmap import mmap
+    from types import CodeType, ModuleType
+    from socket import socket
 
 __all__ = [
     'ConfigError',
     'ConfigModuleNotFoundError',
     'ConfigModuleNotValidError',
     'ConfigObjectNotInitializedError',
+    'ConfigPropertyNotColumnarError',
     'ConfigPropertyNotFoundError',
     'ConfigPropertyNotScalarError',
+    'ConfigReferenceNotValidError',
     'ConfigUpdateNotValidError',
+    'ConfigVersionNotAvailableError',
+    'Config',
+    'ConfigChange',
+    'ConfigClient',
+    'ConfigFootprint',
+    'ConfigServer',
+    'ConfigStore',
+    'ConfigView',
+    'FileValue',
+    'TraceRecorder',
+    'Tracer',
+    'accessor_class',
+    'add_put_argument',
+    'adopt_blob',
+    'changes',
+    'compile_store',
+    'dump',
+    'export_blob',
+    'footprint',
+    'freeze',
     'get',
+    'get_columns',
+    'get_matching',
+    'get_prefixed',
+    'get_typed',
     'init',
+    'init_async',
+    'override',
     'put',
+    'put_arguments',
+    'reload',
+    'reload_async',
+    'serve',
+    'set_tracer',
+    'version',
+    'watch',
 ]
 
 
+MISSES_CACHE_SIZE = 1024
+COLUMNS_CACHE_SIZE = 256
+CLIENT_CACHE_SIZE = 4096
+JOURNAL_SIZE = 1024
+LOG_COMPACT_RECORDS = 1000
+FILE_VALUES_CACHE_SIZE = 64 * 2 ** 20
+
 DEFAULTS_CONFIG_MODULE_NAME = 'defaults'
 LOCALS_CONFIG_MODULE_NAME = 'locals'
-
-_CONFIG_DATA = munchify({})
+FRAGMENTS_CONFIG_DIR_NAME = 'conf.d'
+FRAGMENTS_LOAD_WORKERS = 8
+
+_ACCESSOR_CLASSES = {}
+_MODULES = {}
+_MISSING = object()
+_STORE_MAGIC = b'CFGSTOR1'
+_BLOB_MAGIC = b'CFGBLOB'
+_REFERENCE_PATTERN = r'\$\$\{|\$\{([^}]*)\}'
+_NOT_FOUND = object()
+_dict_get = dict.get
+_dict_items = dict.items
+_dict_getitem = dict.__getitem__
+_dict_setitem = dict.__setitem__
+_dict_pop = dict.pop
+_SCOPES = ContextVar('configaro_scopes', default=None)
 
 
 class ConfigError(BaseException):
@@ -81,9 +146,13 @@ class ConfigModuleNotValidError(ConfigError):
 
 
 class ConfigPropertyNotFoundError(ConfigError):
-    """Config property not found error."""
+    """Config property not found error.
 
-    def __init__(self, data: Munch, prop_name: str):
+    The config object data is only weakly referenced, when possible, so that
+    errors do not keep large sub config objects alive.
+    """
+
+    def __init__(self, data: dict, prop_name: str):
         """Initialize new ConfigPropertyNotFoundError object.
 
         Args:
@@ -95,11 +164,37 @@ class ConfigPropertyNotFoundError(ConfigError):
         self.data = data
         self.prop_name = prop_name
 
+    @property
+    def data(self) -> dict:
+        """Config object data accessor, None if it no longer exists."""
+        return self._data() if self._weak else self._data
+
+    @data.setter
+    def data(self, data: dict):
+        try:
+            self._data, self._weak = ref(data), True
+        except TypeError:
+            self._data, self._weak = data, False
+
+
+class ConfigPropertyNotColumnarError(ConfigError):
+    """Config property not columnar error."""
+
+    def __init__(self, prop_name: str):
+        """Initialize new ConfigPropertyNotColumnarError object.
+
+        Args:
+            prop_name: config property name
+
+        """
+        super().__init__(f'config property not columnar: {prop_name}')
+        self.prop_name = prop_name
+
 
 class ConfigPropertyNotScalarError(ConfigError):
     """Config property not scalar error."""
 
-    def __init__(self, data: Munch, prop_name: str):
+    def __init__(self, data: dict, prop_name: str):
         """Initialize new ConfigPropertyNotScalarError object.
 
         Args:
@@ -112,6 +207,20 @@ class ConfigPropertyNotScalarError(ConfigError):
         self.prop_name = prop_name
 
 
+class ConfigReferenceNotValidError(ConfigError):
+    """Config reference not valid error."""
+
+    def __init__(self, prop_names: List[str]):
+        """Initialize new ConfigReferenceNotValidError object.
+
+        Args:
+            prop_names: config property names forming a reference cycle
+
+        """
+        super().__init__(f'config reference not valid: {" -> ".join(prop_names)}')
+        self.prop_names = prop_names
+
+
 class ConfigUpdateNotValidError(ConfigError):
     """Config update not valid error."""
 
@@ -126,7 +235,422 @@ class ConfigUpdateNotValidError(ConfigError):
         self.update = update
 
 
-def init(config_package: str, locals_path: str=None, locals_env_var: str=None):
+class ConfigVersionNotAvailableError(ConfigError):
+    """Config version no longer available in change journal error."""
+
+    def __init__(self, version: int):
+        """Initialize new ConfigVersionNotAvailableError object.
+
+        Args:
+            version: config object version
+
+        """
+        super().__init__(f'config version not available: {version}')
+        self.version = version
+
+
+class ConfigChange:
+    """Config change record class."""
+
+    __slots__ = ('version', 'prop_name', 'old_value', 'new_value')
+
+    def __init__(self, version: int, prop_name: str, old_value: Any, new_value: Any):
+        """Initialize new ConfigChange object.
+
+        Args:
+            version: config object version created by the change
+            prop_name: config property name
+            old_value: config value before the change, None if it did not exist
+            new_value: config value after the change, None if it no longer exists
+
+        """
+        self.version = version
+        self.prop_name = prop_name
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __repr__(self) -> str:
+        return f'ConfigChange({self.version}, {self.prop_name!r}, {self.old_value!r}, {self.new_value!r})'
+
+
+class ConfigFootprint:
+    """Config footprint record class."""
+
+    __slots__ = ('prop_name', 'size', 'nodes', 'leaves', 'duplicates')
+
+    def __init__(self, prop_name: str, size: int, nodes: int, leaves: int, duplicates: int):
+        """Initialize new ConfigFootprint object.
+
+        Args:
+            prop_name: config property name
+            size: bytes of memory used by the config value, not counting objects already counted
+            nodes: number of sub config objects in the config value, itself included
+            leaves: number of scalar config values in the config value
+            duplicates: number of scalar config values equal to, but not the same object as, one counted before
+
+        """
+        self.prop_name = prop_name
+        self.size = size
+        self.nodes = nodes
+        self.leaves = leaves
+        self.duplicates = duplicates
+
+    def __repr__(self) -> str:
+        return (f'ConfigFootprint({self.prop_name!r}, size={self.size}, nodes={self.nodes}, leaves={self.leaves}, '
+                f'duplicates={self.duplicates})')
+
+
+class ConfigView(dict):
+    """Config view class.
+
+    Sub config objects are returned by :meth:`configaro.get` as read-only
+    dicts of the config data, providing dot-addressable attribute access as
+    well as the usual dict API::
+
+        log = get('log')
+        assert log.level == log['level']
+
+    Views are the config data itself rather than copies of it, so they
+    reflect changes made with :meth:`configaro.put` later on, and can be
+    serialized with :mod:`json` like any dict.  Use dict-style access for
+    config properties named like dict methods, such as ``items``.  File
+    values are read when accessed.
+    """
+
+    __slots__ = ()
+
+    def __getattribute__(self, name: str) -> Any:
+        # Look up config properties first, rather than after failing to find
+        # an attribute, which is much slower.  Methods take precedence.
+        if name in _VIEW_NAMES:
+            return _object_getattribute(self, name)
+        value = _dict_get(self, name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(name)
+        return value.read() if value.__class__ is FileValue else value
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f'config views are read-only, use put() to modify: {name}')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'config views are read-only, use put() to modify: {name}')
+
+    def __getitem__(self, name: str) -> Any:
+        value = _dict_getitem(self, name)
+        return value.read() if value.__class__ is FileValue else value
+
+    def __repr__(self) -> str:
+        return f'ConfigView({dict.__repr__(self)})'
+
+    def __dir__(self) -> List[str]:
+        return [*self, *object.__dir__(self)]
+
+    def __reduce__(self) -> tuple:
+        return ConfigView, (dict(self),)
+
+    def get(self, name: str, default: Any=None) -> Any:
+        """Get config value of child config property.
+
+        Args:
+            name: child config property name
+            default: value returned if child config property is not found
+
+        Returns:
+            config value, or view of sub config object
+
+        """
+        value = _dict_get(self, name, _MISSING)
+        if value is _MISSING:
+            return default
+        return value.read() if value.__class__ is FileValue else value
+
+    def values(self) -> Iterator[Any]:
+        """Get child config values."""
+        return (_resolve(value) for value in dict.values(self))
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Get child config property names and values."""
+        return ((name, _resolve(value)) for name, value in _dict_items(self))
+
+    def _asdict(self) -> dict:
+        """Get copy of config data."""
+        return _copy(self)
+
+    def _read_only(self, *args: Any, **kwargs: Any):
+        raise TypeError('config views are read-only, use put() to modify')
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+_VIEW_NAMES = frozenset(dir(ConfigView))
+_object_getattribute = object.__getattribute__
+
+
+class _Data(ConfigView):
+    """Root config object data class, weakly referenceable unlike dict."""
+
+    __slots__ = ('__weakref__',)
+
+    def __reduce__(self) -> tuple:
+        return _Data, (dict(self),)
+
+
+class FileValue:
+    """Config file value class.
+
+    Refers to a file holding a config value, such as a certificate, allow-list
+    or template, from a config module::
+
+        import os
+        from configaro import FileValue
+
+        config = {
+            'tls': {
+                'cert': FileValue(os.path.join(os.path.dirname(__file__), 'server.pem'))
+            }
+        }
+
+    The file is only read when its config value is queried with
+    :meth:`configaro.get`, which returns its contents rather than the
+    FileValue object.  Contents are cached, least recently used first out,
+    within a budget of :data:`FILE_VALUES_CACHE_SIZE` bytes shared by all
+    file values, and re-read when the file's modification time or size
+    changes.  File values found in sub config objects are not read.
+    """
+
+    __slots__ = ('path', 'binary', 'encoding')
+
+    def __init__(self, path: str, binary: bool=False, encoding: str='utf-8'):
+        """Initialize new FileValue object.
+
+        Args:
+            path: path of file holding the config value, relative to the current directory if not absolute
+            binary: read file contents as bytes rather than text
+            encoding: encoding of text file contents
+
+        """
+        self.path = os.path.abspath(path)
+        self.binary = binary
+        self.encoding = encoding
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, FileValue) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f'FileValue({self.path!r})'
+
+    def read(self) -> Union[str, bytes]:
+        """Read the config value from its file, or from the file values cache.
+
+        Returns:
+            file contents
+
+        Raises:
+            OSError: if file cannot be read
+
+        """
+        return _FILE_VALUES.read(self)
+
+    def _key(self) -> Tuple[str, bool, str]:
+        return self.path, self.binary, self.encoding
+
+
+class _FileValues:
+    """File values cache class, evicting least recently used contents first."""
+
+    __slots__ = ('_entries', '_used', '_lock')
+
+    def __init__(self):
+        # Dicts keep insertion order, so entries are moved to the end when
+        # used and evicted from the start.
+        self._entries = {}
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def read(self, file_value: FileValue) -> Union[str, bytes]:
+        key = file_value._key()
+        stat = os.stat(file_value.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._entries[key] = entry
+                    return entry[1]
+                self._used -= entry[0][1]
+        if file_value.binary:
+            with open(file_value.path, 'rb') as infile:
+                value = infile.read()
+        else:
+            with open(file_value.path, encoding=file_value.encoding) as infile:
+                value = infile.read()
+        if stat.st_size > FILE_VALUES_CACHE_SIZE:
+            return value
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._used -= entry[0][1]
+            self._entries[key] = (stamp, value)
+            self._used += stamp[1]
+            while self._used > FILE_VALUES_CACHE_SIZE:
+                oldest = next(iter(self._entries))
+                self._used -= self._entries.pop(oldest)[0][1]
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._used = 0
+
+    def after_fork(self):
+        # The lock may have been held by a thread of the parent process.
+        self._lock = threading.Lock()
+
+
+_FILE_VALUES = _FileValues()
+
+
+class Tracer:
+    """Tracer base class.
+
+    Tracers receive spans timing the phases of building config objects, such
+    as loading each config module and merging them.  Subclasses implement
+    :meth:`span` and are installed with :meth:`configaro.set_tracer`.  This
+    base class records nothing, and is the tracer used by default.
+    """
+
+    def span(self, name: str, **args: Any) -> '_Span':
+        """Start a span.
+
+        Spans are context managers, entered for the duration of the traced
+        phase.  Entering a span returns an object with a ``set(**args)``
+        method adding arguments, such as sizes, known only once the phase is
+        done.  Spans entered while another span is entered in the same thread
+        are nested in it.
+
+        Args:
+            name: span name
+            args: span arguments
+
+        Returns:
+            span context manager
+
+        """
+        return _NO_SPAN
+
+
+class TraceRecorder(Tracer):
+    """Trace recorder class.
+
+    Records spans as Chrome trace events, which can be written to a file and
+    loaded into ``chrome://tracing`` or Perfetto::
+
+        recorder = TraceRecorder()
+        set_tracer(recorder)
+        init('my_project.config')
+        with open('init-trace.json', 'w') as outfile:
+            recorder.dump(outfile)
+    """
+
+    def __init__(self):
+        """Initialize new TraceRecorder object."""
+        from time import perf_counter_ns
+
+        self.events = []
+        self._clock = perf_counter_ns
+        self._started = perf_counter_ns()
+
+    def span(self, name: str, **args: Any) -> '_Span':
+        """Start a recorded span.  See :meth:`Tracer.span` for details."""
+        return _RecordedSpan(self, name, args)
+
+    def to_chrome_trace(self) -> dict:
+        """Get recorded spans in Chrome trace event format.
+
+        Returns:
+            trace with a complete event per span, timed in microseconds since the recorder was created
+
+        """
+        return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def dump(self, outfile: IO[str]):
+        """Write recorded spans as Chrome trace event JSON.
+
+        Args:
+            outfile: file to write to
+
+        """
+        from json import dump
+
+        dump(self.to_chrome_trace(), outfile, default=str)
+
+
+class _Span:
+    """Span class, recording nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_Span':
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        pass
+
+    def __bool__(self) -> bool:
+        # Spans not recording are false, so that span arguments that are
+        # costly to compute can be skipped.
+        return False
+
+    def set(self, **args: Any):
+        pass
+
+
+class _RecordedSpan(_Span):
+    """Span class, recording a Chrome trace complete event."""
+
+    __slots__ = ('_recorder', '_name', '_args', '_start')
+
+    def __init__(self, recorder: TraceRecorder, name: str, args: dict):
+        self._recorder = recorder
+        self._name = name
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> '_RecordedSpan':
+        self._start = self._recorder._clock()
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        recorder = self._recorder
+        end = recorder._clock()
+        if exc_info[0] is not None:
+            self._args['error'] = exc_info[0].__name__
+        recorder.events.append({
+            'name': self._name,
+            'cat': 'configaro',
+            'ph': 'X',
+            'ts': (self._start - recorder._started) / 1000,
+            'dur': (end - self._start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self._args,
+        })
+
+    def __bool__(self) -> bool:
+        return True
+
+    def set(self, **args: Any):
+        self._args.update(args)
+
+
+_NO_SPAN = _Span()
+_TRACER = Tracer()
+
+
+def init(config_package: str, locals_path: str=None, locals_env_var: str=None, store_path: str=None, log_path: str=None):
     """Initialize the config object.
 
     The config object must be initialized before use and is built from one or
@@ -161,6 +685,57 @@ def init(config_package: str, locals_path: str=None, locals_env_var: str=None):
 
         init('my_project.config', locals_env_var='MY_PROJECT_CONFIG_LOCALS')
 
+    Config modules owned by different parties can also be dropped, as config
+    fragments, into a ``conf.d`` directory in the config package.  Config
+    fragments are loaded in file name order after the **defaults** config
+    module and before any **locals** config module, so name them with a
+    numeric prefix, such as ``10-logging.py``, to control their precedence.
+
+    Very large, read-only config data, such as routing tables, can be compiled
+    into a config store file with :meth:`configaro.compile_store`.  If the
+    optional *store_path* argument is provided, the config store is memory
+    mapped as a layer below the config modules, answering queries for config
+    properties that they do not define::
+
+        init('my_project.config', store_path='/var/lib/my_project/routes.cfgs')
+
+    Config store properties are only found when queried by name, so they are
+    not held by the root config object, nor reported by
+    :meth:`configaro.get_matching`, :meth:`configaro.get_prefixed`,
+    :meth:`configaro.dump` or :meth:`configaro.footprint`.
+
+    String config values can refer to other config values with ``${name}``
+    references, resolved once all config modules are merged.  A string that
+    is a single reference takes the referenced config value as is, otherwise
+    referenced config values are formatted into the string.  Write ``$${``
+    for a literal ``${``::
+
+        config = {
+            'log': {
+                'dir': '/var/log/my_project',
+                'file': '${log.dir}/app.log'
+            }
+        }
+
+    Config values referring to config values modified with
+    :meth:`configaro.put` are resolved again, also on config objects with a
+    base.  Values of overrides made with :meth:`configaro.override`, and
+    references put on config objects with a base, are taken literally.
+
+    Config values modified with :meth:`configaro.put` are lost when the
+    process exits, unless the optional *log_path* argument is provided.  Each
+    :meth:`configaro.put` is then appended to the override log file at that
+    path, and the override log is replayed on top of the config modules by
+    :meth:`configaro.init` and :meth:`configaro.reload`::
+
+        init('my_project.config', log_path='/var/lib/my_project/overrides.log')
+
+    Puts are written to the override log file by a background thread, which
+    syncs them to disk in groups, so that puts do not wait for the disk.  The
+    override log is compacted into a snapshot of the current overrides after
+    every :data:`LOG_COMPACT_RECORDS` puts.  Logged puts of config properties
+    no longer found in the config modules are dropped on replay.
+
     Repeated initialization has no effect.  You can not re-initialize with
     different values.
 
@@ -168,17 +743,15 @@ def init(config_package: str, locals_path: str=None, locals_env_var: str=None):
         config_package: package to search for config modules
         locals_path: path to locals config module
         locals_env_var: name of environment variable providing path to locals config module
+        store_path: path to config store file
+        log_path: path to override log file
 
-    """
-    global _CONFIG_DATA
-    if _CONFIG_DATA:
-        return
+    Raises:
+        configaro.ConfigPropertyNotFoundError: if a referenced config property is not found
+        configaro.ConfigReferenceNotValidError: if config values refer to each other in a cycle
 
-    for path in _config_module_paths(config_package, locals_path, locals_env_var):
-        deltas = _load(path)
-        merged = dict(_merge(_CONFIG_DATA, deltas))
-        _CONFIG_DATA = merged
-    _CONFIG_DATA = munchify(_CONFIG_DATA)
+    """
+    _CONFIG.init(config_package, locals_path, locals_env_var, store_path, log_path)
 
 
 def get(*prop_names: str, **kwargs: str) -> Any:
@@ -219,14 +792,125 @@ def get(*prop_names: str, **kwargs: str) -> Any:
         configaro.ConfigPropertyNotFoundError: if a config property in *prop_names* is not found
 
     """
-    if not _CONFIG_DATA:
-        raise ConfigObjectNotInitializedError()
-    if not prop_names or len(prop_names) == 1 and prop_names[0] is None:
-        return _CONFIG_DATA
-    if len(prop_names) == 1:
-        return _get(_CONFIG_DATA, prop_names[0], **kwargs)
-    else:
-        return tuple([_get(_CONFIG_DATA, prop_name, **kwargs) for prop_name in prop_names])
+    return _CONFIG.get(*prop_names, **kwargs)
+
+
+def get_typed(*prop_names: str, **kwargs: str) -> Any:
+    """Query config values in config object as typed accessor objects.
+
+    This function behaves like :meth:`configaro.get`, except that sub config
+    objects are returned as instances of generated ``__slots__`` classes, see
+    :meth:`configaro.accessor_class`, instead of dot-addressable dicts::
+
+        log = get_typed('log')
+        for record in records:
+            if log.level == 'DEBUG':
+                ...
+
+    Reading a field of an accessor object is a plain slot read, which makes it
+    well suited to config properties read in tight loops.  Accessor objects
+    are snapshots cached per property name until the next :meth:`configaro.put`,
+    so hold on to them only as long as stale values are acceptable.
+
+    Args:
+        prop_names: config property names
+        kwargs: config property names and values keyword args
+
+    Returns:
+        property values
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if a config property in *prop_names* is not found
+
+    """
+    return _CONFIG.get_typed(*prop_names, **kwargs)
+
+
+def get_columns(prop_name: str, numpy: bool=False) -> Any:
+    """Query a list config value as columnar arrays.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    A list of numbers is returned as a single array, and a list of dicts with
+    the same keys, such as a list of backends, as a dict of arrays keyed by
+    column name, ready for vectorized consumers::
+
+        backends = get_columns('backends')
+        total_weight = sum(backends['weight'])
+
+    Columns of ints and of floats are returned as :class:`array.array`
+    objects, and other columns as tuples.  If the optional *numpy* argument is
+    true, all columns are returned as read-only NumPy arrays instead, which
+    requires NumPy to be installed.  Columns are cached until the next
+    :meth:`configaro.put` and must not be modified.
+
+    Args:
+        prop_name: config property name of list config value
+        numpy: return NumPy arrays
+
+    Returns:
+        array, or dict of arrays by column name
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if property is not found
+        configaro.ConfigPropertyNotColumnarError: if config value is not a list of numbers or of dicts with the same keys
+
+    """
+    return _CONFIG.get_columns(prop_name, numpy)
+
+
+def accessor_class(schema: dict, name: str='Config') -> type:
+    """Generate a typed accessor class for config data or a config schema.
+
+    The *schema* argument is either config data, such as a sub config object
+    returned by :meth:`configaro.get`, or a dict mapping property names to
+    value types, with nested dicts describing nested config objects::
+
+        Log = accessor_class({'file': str, 'level': str}, name='Log')
+
+    The generated class defines one ``__slots__`` field per property and
+    carries the property types in its ``__annotations__``.  Classes are cached
+    in-process by name and shape, so generating the class for equally shaped
+    config data twice returns the same class.
+
+    Args:
+        schema: config data or config schema
+        name: name of the generated class
+
+    Returns:
+        typed accessor class
+
+    Raises:
+        configaro.ConfigError: if a property name is not a valid Python identifier
+
+    """
+    from keyword import iskeyword
+
+    annotations = {}
+    for prop_name, value in schema.items():
+        if isinstance(value, dict):
+            annotations[prop_name] = accessor_class(value, _accessor_name(prop_name))
+        elif isinstance(value, type):
+            annotations[prop_name] = value
+        else:
+            annotations[prop_name] = type(value)
+    key = (name, tuple(annotations.items()))
+    try:
+        return _ACCESSOR_CLASSES[key]
+    except KeyError:
+        pass
+    for prop_name in annotations:
+        if not prop_name.isidentifier() or iskeyword(prop_name):
+            raise ConfigError(f'config property not a valid accessor field: {prop_name}')
+    cls = type(name, (_Accessor,), {
+        '__slots__': tuple(annotations),
+        '__annotations__': annotations,
+        '__module__': __name__,
+    })
+    _ACCESSOR_CLASSES[key] = cls
+    return cls
 
 
 def put(*args: str, **kwargs: str):
@@ -272,88 +956,2900 @@ def put(*args: str, **kwargs: str):
 
     Raises:
         configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if config property is not found
         configaro.ConfigPropertyNotScalarError: if config property is not a scalar
         configaro.ConfigUpdateNotValidError: if config update string is not valid
 
     """
-    if not _CONFIG_DATA:
-        raise ConfigObjectNotInitializedError()
+    _CONFIG.put(*args, **kwargs)
 
-    # Handle passing in a single dict arg.
-    if len(args) == 1 and isinstance(args[0], dict):
-        _CONFIG_DATA.update(args[0])
-        return
 
-    # Handle passing in a prop name and an update value of any sort other than string.
-    if len(args) == 2 and isinstance(args[0], str) and not isinstance(args[1], str):
-        _put(_CONFIG_DATA, args[0], args[1])
-        return
+def add_put_argument(parser: ArgumentParser, *flags: str, **kwargs: Any) -> Action:
+    """Add a repeatable command line argument collecting config update strings.
 
-    # Handle positional string arguments.  If the caller wishes to modify
-    # nested properties, they must be passed in as update strings, such as
-    # 'log.level=INFO'.  Values will be cast from strings to their appropriate
-    # type.  Multiple updates can be specified in a single string separated by
-    # whitespace.
-    if len(args) == 1 and isinstance(args[0], str):
-        args = args[0].split()
-    for arg in args:
-        try:
-            prop_name, value = arg.split('=')
-            prop_value = _cast(value)
-            _put(_CONFIG_DATA, prop_name, prop_value)
-        except ValueError:
-            raise ConfigUpdateNotValidError(arg)
+    The argument, ``--set`` unless other *flags* are given, collects one
+    ``name=value`` update string per occurrence, in order, to be applied with
+    a single :meth:`configaro.put`::
 
-    # Handle any keyword arguments.  If the caller doesn't care about nested
-    # property updates, property names and values may be passed in keyword args.
-    for prop_name, prop_value in kwargs.items():
-        _put(_CONFIG_DATA, prop_name, prop_value)
+        parser = ArgumentParser()
+        add_put_argument(parser)
+        args = parser.parse_args()
+        put_arguments(parser, args.set)
 
+    Malformed update strings are reported by the parser while parsing, naming
+    the argument, and unknown config properties by
+    :meth:`configaro.put_arguments`, naming the argument and its position.
+    A single put applies all updates as one change, or none of them if one
+    fails, resolving the sub config object holding each config
+    property once rather than once per update, which keeps launching jobs
+    with hundreds of overrides cheap.
 
-def _config_module_paths(config_package: str, locals_path: str=None, locals_env_var: str=None) -> List[str]:
-    """Config module paths accessor.
+    Args:
+        parser: argument parser
+        flags: argument option strings, ``--set`` if omitted
+        kwargs: :meth:`argparse.ArgumentParser.add_argument` keyword args overriding the defaults
 
     Returns:
-        config module paths
-
-    Raises:
-        configaro.ConfigModuleNotFoundError: if config module not found
+        added argument action
 
     """
-    config_paths = []
-    package_dir = _config_package_dir(config_package)
+    options = {
+        'action': 'append',
+        'default': [],
+        'type': _update_arg,
+        'metavar': 'NAME=VALUE',
+        'help': 'override config value, may be repeated',
+    }
+    options.update(kwargs)
+    return parser.add_argument(*(flags or ('--set',)), **options)
 
-    # Start by adding the 'defaults' config module in the config package.
-    defaults_path = os.path.join(package_dir, f'{DEFAULTS_CONFIG_MODULE_NAME}.py')
-    if not os.path.exists(defaults_path):
-        raise ConfigModuleNotFoundError(defaults_path)
-    config_paths.append(defaults_path)
 
-    # Continue by adding the 'locals' config module from.
-    if not locals_path and locals_env_var:
-        locals_path = os.environ.get(locals_env_var)
-    if not locals_path:
-        locals_path = os.path.join(package_dir, f'{LOCALS_CONFIG_MODULE_NAME}.py')
-    if os.path.exists(locals_path):
-        config_paths.append(locals_path)
-    return config_paths
+def put_arguments(parser: ArgumentParser, updates: List[str], option: str='--set'):
+    """Modify config values in config object from command line update strings.
 
+    The config object must be initialized with :meth:`configaro.init` before use.
 
-def _config_package_dir(config_package: str) -> str:
-    """Config package directory accessor.
+    The update strings collected by an argument added with
+    :meth:`configaro.add_put_argument` are applied with a single put, as one
+    change or not at all.  An update that fails is reported with
+    :meth:`argparse.ArgumentParser.error`, naming the argument and its
+    position, such as ``argument --set #2: log.nope=1``, which exits.
 
-    Returns:
-        config package directory
+    Args:
+        parser: argument parser
+        updates: config update strings
+        option: argument option string named in errors
 
     Raises:
-        ImportError: if config package defaults cannot be loaded.
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
 
     """
-    module = import_module(f'{config_package}.defaults')
-    return os.path.dirname(module.__file__)
+    _CONFIG.put_arguments(parser, updates, option)
 
 
-def _cast(value: str) -> Union[None, bool, int, float, str]:
+def get_matching(pattern: str) -> Iterator[Tuple[str, Any]]:
+    """Query config values in config object by property name pattern.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    Each dot-separated part of *pattern* is either a property name or a
+    wildcard, using the ``*``, ``?`` and ``[seq]`` wildcards supported by the
+    :mod:`fnmatch` module.  Properties at the depth of the pattern whose names
+    match are lazily returned as dotted property name and value pairs, in
+    property name order::
+
+        for prop_name, disabled in get_matching('monitoring.*.disabled'):
+            if disabled:
+                print(f'{prop_name} is disabled')
+
+    Queries are answered from a property name index built on first use and
+    maintained by :meth:`configaro.put`, so their cost grows with the number
+    of properties matching the literal parts of the pattern rather than with
+    the size of the config object.
+
+    Args:
+        pattern: config property name pattern
+
+    Returns:
+        iterator of matching config property names and values
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+    """
+    return _CONFIG.get_matching(pattern)
+
+
+def get_prefixed(prefix: str=None) -> Iterator[Tuple[str, Any]]:
+    """Query scalar config values in config object below a property.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    All scalar config values in the sub config object identified by *prefix*,
+    or in the whole config object if no *prefix* is provided, are lazily
+    returned as dotted property name and value pairs::
+
+        for prop_name, value in get_prefixed('log'):
+            print(f'{prop_name}={value}')
+
+    Args:
+        prefix: config property name
+
+    Returns:
+        iterator of config property names and scalar values
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if config property *prefix* is not found
+
+    """
+    return _CONFIG.get_prefixed(prefix)
+
+
+def dump(outfile: IO[str], prefix: str=None, as_json: bool=False):
+    """Write config values in config object to a file object.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    By default, scalar config values are written as ``name=value`` update
+    strings, one per line, in the format accepted by :meth:`configaro.put`::
+
+        dump(sys.stdout)
+
+    If *as_json* is True, config values are written as a JSON object instead::
+
+        dump(sys.stdout, prefix='log', as_json=True)
+
+    Config values are streamed to *outfile* as the config object is walked,
+    without building intermediate copies of it, so memory use does not grow
+    with its size.  Only the config object itself is streamed though; config
+    objects with overrides, see :class:`configaro.Config` and
+    :meth:`configaro.override`, first merge the overridden sub config objects.
+
+    String values containing whitespace or ``=`` characters can not be parsed
+    back by :meth:`configaro.put`, and values of other than scalar or dict
+    types are written as strings.
+
+    Args:
+        outfile: file object to write to
+        prefix: config property name of sub config object to write
+        as_json: write config values as a JSON object
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if config property *prefix* is not found
+
+    """
+    _CONFIG.dump(outfile, prefix, as_json)
+
+
+def compile_store(path: str, data: dict):
+    """Compile config data into a config store file.
+
+    A config store file holds the scalar config values of *data* in a table
+    of dotted property names, sorted for binary search and indexed by a hash
+    table, with offsets into a blob of JSON encoded values.  Opened with :class:`configaro.ConfigStore`,
+    it is memory mapped and its values are only decoded when queried, so that
+    configs with millions of scalar values cost neither the memory nor the
+    time of building dicts for them::
+
+        compile_store('/var/lib/my_project/routes.cfgs', {'routes': routes})
+
+    The file is written to a temporary file first and then atomically renamed.
+    Offsets are written in native byte order, so compile stores on machines of
+    the same architecture as those opening them.
+
+    Args:
+        path: path of config store file to write
+        data: config data
+
+    """
+    from array import array
+    from json import dumps
+    from zlib import crc32
+
+    items = sorted((prop_name.encode(), dumps(value, separators=(',', ':'), default=str).encode())
+                   for prop_name, value in _flatten('', data))
+    key_offsets = array('Q', [0])
+    value_offsets = array('Q', [0])
+    slots = array('Q', bytes(8 * _store_slots(len(items))))
+    for index, (key, value) in enumerate(items, 1):
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+        slot = crc32(key) % len(slots)
+        while slots[slot]:
+            slot = (slot + 1) % len(slots)
+        slots[slot] = index
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as outfile:
+        outfile.write(_STORE_MAGIC)
+        outfile.write(array('Q', [len(items)]).tobytes())
+        outfile.write(key_offsets.tobytes())
+        outfile.write(value_offsets.tobytes())
+        outfile.write(slots.tobytes())
+        for key, _ in items:
+            outfile.write(key)
+        for _, value in items:
+            outfile.write(value)
+    os.replace(temp_path, path)
+
+
+def reload():
+    """Reload the config object from its config modules.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    The config modules, and config fragments, used to initialize the config
+    object are loaded again and replace its config data.  Any changes made
+    with :meth:`configaro.put` are lost, unless recorded in an override log.
+    Changed scalar config values are recorded in the change journal, see
+    :meth:`configaro.changes`.
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+    """
+    _CONFIG.reload()
+
+
+async def init_async(config_package: str, locals_path: str=None, locals_env_var: str=None, store_path: str=None,
+                     log_path: str=None):
+    """Initialize the config object without blocking the event loop.
+
+    Finding, reading, compiling and executing the config modules is done in
+    the default executor of the running event loop::
+
+        await init_async('my_project.config')
+
+    See :meth:`configaro.init` for details.
+
+    Args:
+        config_package: package to search for config modules
+        locals_path: path to locals config module
+        locals_env_var: name of environment variable providing path to locals config module
+        store_path: path to config store file
+        log_path: path to override log file
+
+    """
+    await _CONFIG.init_async(config_package, locals_path, locals_env_var, store_path, log_path)
+
+
+async def reload_async():
+    """Reload the config object without blocking the event loop.
+
+    See :meth:`configaro.reload` and :meth:`configaro.init_async` for details.
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+    """
+    await _CONFIG.reload_async()
+
+
+def watch() -> AsyncIterator[ConfigChange]:
+    """Watch changes made to the config object from a coroutine.
+
+    Returns an asynchronous iterator of the change records of each
+    :meth:`configaro.put` and :meth:`configaro.reload` made from then on, by
+    any thread, delivered through the running event loop::
+
+        async for change in watch():
+            if change.prop_name.startswith('log.'):
+                configure_logging()
+
+    Must be called from a coroutine running in an event loop.  The config
+    object stops recording changes for the iterator once it is closed.
+
+    Returns:
+        asynchronous iterator of config change records
+
+    """
+    return _CONFIG.watch()
+
+
+def export_blob() -> bytes:
+    """Export the config object as a binary blob.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    The blob holds the config data, including changes made with
+    :meth:`configaro.put`, in :mod:`marshal` format, which keeps a single copy
+    of repeated keys and has no per-object class overhead.  Config data that
+    :mod:`marshal` does not support, such as file values, is exported with
+    :mod:`pickle` instead.  Pass the blob to processes, such as
+    :mod:`multiprocessing` workers started with the spawn method, that adopt
+    it with :meth:`configaro.adopt_blob` rather than running the config
+    modules again::
+
+        worker = Process(target=work, args=(configaro.export_blob(),))
+
+    Blobs are only meant to be adopted by processes running the same Python
+    version.
+
+    Returns:
+        blob
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+    """
+    return _CONFIG.export_blob()
+
+
+def adopt_blob(blob: bytes):
+    """Initialize the config object from a blob exported by :meth:`configaro.export_blob`.
+
+    No config modules are run.  The config object is reloaded from the same
+    config modules, and uses the same config store, as the exporting config
+    object, but does not record changes in its override log.  Like
+    :meth:`configaro.init`, adopting a blob has no effect on an initialized
+    config object.
+
+    Args:
+        blob: blob
+
+    Raises:
+        configaro.ConfigModuleNotValidError: if blob was not exported by :meth:`configaro.export_blob`
+
+    """
+    _CONFIG.adopt_blob(blob)
+
+
+def footprint(prop_name: str=None) -> List[ConfigFootprint]:
+    """Report the memory footprint of config values.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    Reports the memory used by each top-level config value, or by each config
+    value of the sub config object identified by the optional *prop_name*
+    argument, largest first, to tell which parts of the config object are
+    worth slimming::
+
+        for report in footprint('routes')[:10]:
+            print(report.prop_name, report.size, report.duplicates)
+
+    Objects shared between config values, such as interned keys and small
+    numbers, are only counted for the first config value they are found in.
+    Scalar config values equal to one found before, but not the same object,
+    are counted as duplicates, which interning or sharing would save.
+
+    Args:
+        prop_name: config property name of sub config object, all config values if omitted
+
+    Returns:
+        footprints of config values, largest first
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotFoundError: if property is not found
+
+    """
+    return _CONFIG.footprint(prop_name)
+
+
+def freeze():
+    """Freeze the config object for sharing with forked child processes.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    Pre-fork servers initialize the config object once and fork workers that
+    share its memory pages until they are written to.  Freezing compacts the
+    config data, interning keys and sharing equal scalar config values, and
+    moves all objects of the process out of reach of the garbage collector
+    with :func:`gc.freeze`, so that collections in the workers do not write to
+    the pages holding them::
+
+        init('my_project.config')
+        freeze()
+        for _ in range(workers):
+            if os.fork() == 0:
+                serve_requests()
+
+    Config values modified with :meth:`configaro.put` later are not frozen.
+    Forked child processes always start with fresh config object locks and
+    caches, and without the change listeners of the parent, frozen or not.
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+    """
+    _CONFIG.freeze()
+
+
+def version() -> int:
+    """Get version of the config object.
+
+    The version is 0 once the config object is initialized, and is
+    incremented by each :meth:`configaro.put` and :meth:`configaro.reload`.
+    Compare versions to cheaply tell whether the config object changed::
+
+        if version() != seen_version:
+            ...
+
+    Returns:
+        config object version
+
+    """
+    return _CONFIG.version
+
+
+def changes(since: int) -> List[ConfigChange]:
+    """Get changes made to the config object since a version.
+
+    The config object keeps a journal of its most recent changes, holding up
+    to :data:`JOURNAL_SIZE` change records.  Changes replacing sub config
+    objects are recorded as changes of the scalar config properties in them
+    that changed.  Consumers holding a version can
+    fetch just the changes made after it, in the order they were made::
+
+        for change in changes(seen_version):
+            print(change.prop_name, change.old_value, change.new_value)
+        seen_version = change.version
+
+    Args:
+        since: config object version
+
+    Returns:
+        config change records
+
+    Raises:
+        configaro.ConfigVersionNotAvailableError: if changes since *since* are no longer in the journal
+
+    """
+    return _CONFIG.changes(since)
+
+
+def serve(path: str, config: Config=None) -> ConfigServer:
+    """Serve the config object over a Unix domain socket.
+
+    The config object must be initialized with :meth:`configaro.init` before
+    config clients query it.
+
+    When many lightweight processes only read config, the process owning the
+    config object can serve it to them instead of each of them initializing
+    their own.  The server runs in background threads until it is closed::
+
+        server = serve('/run/my_project/config.sock')
+        ...
+        server.close()
+
+    Readers then query it with a :class:`configaro.ConfigClient`.
+
+    Args:
+        path: path of the Unix domain socket to create
+        config: config object to serve, the default config object if not provided
+
+    Returns:
+        running config server
+
+    """
+    server = ConfigServer(path, config)
+    server.start()
+    return server
+
+
+def override(*args: str, **kwargs: str) -> '_Scope':
+    """Temporarily override config values for the current thread or task.
+
+    The config object must be initialized with :meth:`configaro.init` before use.
+
+    This function accepts the same arguments as :meth:`configaro.put` and
+    returns a context manager.  Inside the ``with`` block, queries made from
+    the current thread or asyncio task see the overridden config values,
+    while all other threads and tasks keep seeing the config object as is::
+
+        with override('log.level=DEBUG'):
+            assert get('log.level') == 'DEBUG'
+
+    Override scopes may be nested, inner scopes taking precedence.  Entering
+    and leaving a scope costs time proportional to the number of overrides in
+    effect, and never copies the config object.  Changes made with
+    :meth:`configaro.put` inside a scope still modify the config object.
+
+    Args:
+        args: config dict object or one or more 'some.knob=value' update strings
+        kwargs: config property names and values keyword args
+
+    Returns:
+        override scope context manager
+
+    Raises:
+        configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+        configaro.ConfigPropertyNotScalarError: if config property is not a scalar
+        configaro.ConfigUpdateNotValidError: if config update string is not valid
+
+    """
+    return _CONFIG.override(*args, **kwargs)
+
+
+def set_tracer(tracer: Tracer=None) -> Tracer:
+    """Set the tracer receiving spans timing the phases of building config objects.
+
+    Spans are emitted by :meth:`configaro.init` and :meth:`configaro.reload`
+    for finding the config package, reading, compiling and executing each
+    config module, merging config modules, replaying the override log and
+    resolving references, with sizes such as source bytes and config value
+    counts as span arguments.  Install a :class:`configaro.TraceRecorder` to
+    record them as Chrome trace events::
+
+        recorder = TraceRecorder()
+        set_tracer(recorder)
+
+    Args:
+        tracer: tracer, or None to stop tracing
+
+    Returns:
+        tracer previously set
+
+    """
+    global _TRACER
+
+    previous, _TRACER = _TRACER, Tracer() if tracer is None else tracer
+    return previous
+
+
+class Config:
+    """Config object class.
+
+    The module level :meth:`configaro.init`, :meth:`configaro.get` and
+    :meth:`configaro.put` functions operate on a default config object.  Use
+    this class directly when one process must host several independent config
+    objects, such as one per tenant::
+
+        defaults = Config()
+        defaults.init('my_project.config')
+        tenant = Config(base=defaults)
+        tenant.put('log.level=DEBUG')
+
+    A config object created with a *base* config object is initialized by its
+    base and shares its config data.  It stores only its own overrides, keyed
+    by dotted property name, so its memory grows with the size of its
+    overrides rather than with the size of the config data.  Queries of sub
+    config objects containing overrides return merged copies, all other
+    queries are answered by the base.  The base should be treated as
+    immutable once derived config objects exist, as its changes are visible
+    to them but do not invalidate their typed accessor caches.
+
+    """
+
+    __slots__ = ('_base', '_data', '_overrides', '_prefixes', '_typed', '_index', '_misses', '_columns',
+                 '_sources', '_version', '_journal', '_dropped', '_lock', '_listeners', '_store',
+                 '_interpolation', '_resolved', '_log', '__weakref__')
+
+    def __init__(self, base: 'Config'=None):
+        """Initialize new Config object.
+
+        Args:
+            base: config object providing the base config data
+
+        """
+        self._base = base
+        self._data = None
+        self._overrides = None if base is None else {}
+        self._prefixes = None if base is None else {}
+        self._typed = None
+        self._index = None
+        self._misses = {}
+        self._columns = {}
+        self._sources = None
+        self._version = 0
+        self._journal = None
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._listeners = ()
+        self._store = None
+        self._interpolation = None
+        self._resolved = None if base is None else set()
+        self._log = None
+        _CONFIGS.add(ref(self, _CONFIGS.discard))
+
+    @property
+    def initialized(self) -> bool:
+        """Config object initialized accessor."""
+        return bool(self._data) if self._base is None else self._base.initialized
+
+    @property
+    def version(self) -> int:
+        """Config object version accessor."""
+        return self._version
+
+    def init(self, config_package: str, locals_path: str=None, locals_env_var: str=None, store_path: str=None,
+             log_path: str=None):
+        """Initialize the config object.
+
+        A config object created with a base config object initializes its base.
+        See :meth:`configaro.init` for details.
+
+        """
+        if self._base is not None:
+            self._base.init(config_package, locals_path, locals_env_var, store_path, log_path)
+            return
+        if self._data:
+            return
+        self._sources = (config_package, locals_path, locals_env_var)
+        if log_path is not None:
+            self._log = _OverrideLog(log_path)
+        self._data, self._interpolation = self._build()
+        if store_path is not None:
+            self._store = ConfigStore(store_path)
+
+    def reload(self):
+        """Reload the config object from its config modules.
+
+        A config object created with a base config object reloads its base,
+        keeping its own overrides.  See :meth:`configaro.reload` for details.
+
+        """
+        if self._base is not None:
+            self._base.reload()
+            return
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        # Puts wait for the reload, so that none is applied to the config
+        # data being replaced, or left out of the override log replayed.
+        with self._lock:
+            data, interpolation = self._build()
+            if self._store is not None:
+                # The old config store is closed once queries in progress
+                # are done with it.
+                self._store = ConfigStore(self._store.path)
+            self._interpolation = interpolation
+            old_values = dict(_flatten('', self._data))
+            new_values = dict(_flatten('', data))
+            updates = []
+            for prop_name in sorted(old_values.keys() | new_values.keys()):
+                old_value = old_values.get(prop_name)
+                new_value = new_values.get(prop_name)
+                if prop_name not in old_values or prop_name not in new_values or old_value != new_value:
+                    updates.append((prop_name, old_value, new_value))
+            self._data = data
+            self._typed = None
+            self._index = None
+            self._commit(updates)
+
+    async def init_async(self, config_package: str, locals_path: str=None, locals_env_var: str=None,
+                         store_path: str=None, log_path: str=None):
+        """Initialize the config object without blocking the event loop.
+
+        See :meth:`configaro.init_async` for details.
+
+        """
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.init, config_package, locals_path, locals_env_var, store_path, log_path)
+
+    async def reload_async(self):
+        """Reload the config object without blocking the event loop.
+
+        See :meth:`configaro.reload_async` for details.
+
+        """
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.reload)
+
+    def watch(self) -> AsyncIterator[ConfigChange]:
+        """Watch changes made to the config object from a coroutine.
+
+        See :meth:`configaro.watch` for details.
+
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        batches = asyncio.Queue()
+
+        def listener(records: List[ConfigChange]):
+            # Called with the config object lock held, possibly by another
+            # thread, so only hand the records over to the event loop.
+            try:
+                loop.call_soon_threadsafe(batches.put_nowait, records)
+            except RuntimeError:
+                pass
+
+        # Listen right away rather than on first iteration, so that no change
+        # made after watch() returns is missed.
+        self._listen(listener)
+        return _Watch(self, batches, listener)
+
+    def footprint(self, prop_name: str=None) -> List[ConfigFootprint]:
+        """Report the memory footprint of config values.
+
+        See :meth:`configaro.footprint` for details.
+
+        """
+        value = self._scoped()._lookup(prop_name or '')
+        seen = set()
+        scalars = {}
+        if not isinstance(value, dict):
+            return [_footprint(prop_name, value, seen, scalars)]
+        prefix = f'{prop_name}.' if prop_name else ''
+        reports = [_footprint(f'{prefix}{name}', child, seen, scalars) for name, child in _dict_items(value)]
+        reports.sort(key=lambda report: report.size, reverse=True)
+        return reports
+
+    def freeze(self):
+        """Freeze the config object for sharing with forked child processes.
+
+        A config object created with a base config object freezes its base.
+        See :meth:`configaro.freeze` for details.
+
+        """
+        if self._base is not None:
+            self._base.freeze()
+            return
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        import gc
+
+        with self._lock:
+            self._data = _Data(_compact(self._data, {}))
+            self._typed = None
+            self._index = None
+            self._misses = {}
+            self._columns = {}
+        gc.collect()
+        gc.freeze()
+
+    def export_blob(self) -> bytes:
+        """Export the config object as a binary blob.
+
+        A config object created with a base config object exports its base.
+        See :meth:`configaro.export_blob` for details.
+
+        """
+        if self._base is not None:
+            return self._base.export_blob()
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        with self._lock:
+            templates = {} if self._interpolation is None else {
+                prop_name: template for prop_name, (template, _) in self._interpolation.templates.items()}
+            store_path = None if self._store is None else self._store.path
+            state = (_copy(self._data), templates, self._sources, store_path)
+            try:
+                import marshal
+
+                return _BLOB_MAGIC + b'M' + marshal.dumps(state)
+            except ValueError:
+                import pickle
+
+                return _BLOB_MAGIC + b'P' + pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def adopt_blob(self, blob: bytes):
+        """Initialize the config object from a blob exported by :meth:`export_blob`.
+
+        A config object created with a base config object initializes its base.
+        See :meth:`configaro.adopt_blob` for details.
+
+        """
+        if self._base is not None:
+            self._base.adopt_blob(blob)
+            return
+        if self._data:
+            return
+        magic, tag, payload = blob[:len(_BLOB_MAGIC)], blob[len(_BLOB_MAGIC):len(_BLOB_MAGIC) + 1], blob[len(_BLOB_MAGIC) + 1:]
+        if magic != _BLOB_MAGIC or tag not in (b'M', b'P'):
+            raise ConfigModuleNotValidError('<blob>')
+        with _TRACER.span('adopt', bytes=len(blob)):
+            if tag == b'M':
+                import marshal
+
+                data, templates, sources, store_path = marshal.loads(payload)
+            else:
+                import pickle
+
+                data, templates, sources, store_path = pickle.loads(payload)
+            interpolation = None
+            if templates:
+                interpolation = _Interpolation()
+                for prop_name, template in templates.items():
+                    interpolation.add(prop_name, template)
+            self._sources = tuple(sources)
+            self._interpolation = interpolation
+            if store_path is not None:
+                self._store = ConfigStore(store_path)
+            self._data = _viewed(data, _Data)
+
+    def changes(self, since: int) -> List[ConfigChange]:
+        """Get changes made to the config object since a version.
+
+        See :meth:`configaro.changes` for details.
+
+        """
+        with self._lock:
+            if since < self._dropped:
+                raise ConfigVersionNotAvailableError(since)
+            records = []
+            for record in reversed(self._journal or ()):
+                if record.version <= since:
+                    break
+                records.append(record)
+            records.reverse()
+            return records
+
+    def get(self, *prop_names: str, **kwargs: str) -> Any:
+        """Query config values in config object.
+
+        See :meth:`configaro.get` for details.
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        scopes = _SCOPES.get()
+        if scopes is not None and self in scopes:
+            return scopes[self].get(*prop_names, **kwargs)
+        if not prop_names or len(prop_names) == 1 and prop_names[0] is None:
+            return self._lookup('')
+        if len(prop_names) == 1:
+            return _resolve(self._lookup(prop_names[0], **kwargs))
+        else:
+            return tuple([_resolve(self._lookup(prop_name, **kwargs)) for prop_name in prop_names])
+
+    def get_typed(self, *prop_names: str, **kwargs: str) -> Any:
+        """Query config values in config object as typed accessor objects.
+
+        See :meth:`configaro.get_typed` for details.
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        scopes = _SCOPES.get()
+        if scopes is not None and self in scopes:
+            return scopes[self].get_typed(*prop_names, **kwargs)
+        if not prop_names or len(prop_names) == 1 and prop_names[0] is None:
+            prop_names = ('',)
+        if len(prop_names) == 1 and ' ' in prop_names[0]:
+            prop_names = tuple(prop_names[0].split())
+        # Accessors are tagged with the version they were built at, like
+        # lookup misses, so that one built while a put is in progress is
+        # never trusted.  The cache is read once, as a put may replace it.
+        version = self._version
+        typed = self._typed
+        if typed is None:
+            typed = self._typed = {}
+        values = []
+        for prop_name in prop_names:
+            entry = typed.get(prop_name)
+            if entry is not None and entry[0] == version:
+                value = entry[1]
+            else:
+                value = _resolve(self._lookup(prop_name, **kwargs))
+                if isinstance(value, dict):
+                    value = _accessor(value, prop_name)
+                    typed[prop_name] = (version, value)
+            values.append(value)
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def get_columns(self, prop_name: str, numpy: bool=False) -> Any:
+        """Query a list config value as columnar arrays.
+
+        See :meth:`configaro.get_columns` for details.
+
+        """
+        value = self._scoped()._lookup(prop_name)
+
+        # Config objects with a base share columns of the config data of the
+        # base.  Columns keep their list config values alive, so ids are not
+        # reused while cached.
+        root = self
+        while root._base is not None:
+            root = root._base
+        columns = root._columns
+        key = (id(value), bool(numpy))
+        cached = columns.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        result = _columnar(prop_name, value, numpy)
+        if len(columns) >= COLUMNS_CACHE_SIZE:
+            columns = root._columns = {}
+        columns[key] = (value, result)
+        return result
+
+    def get_matching(self, pattern: str) -> Iterator[Tuple[str, Any]]:
+        """Query config values in config object by property name pattern.
+
+        See :meth:`configaro.get_matching` for details.
+
+        """
+        scoped = self._scoped()
+        return ((prop_name, _resolve(scoped._lookup(prop_name)))
+                for prop_name in scoped._match(pattern.split('.')))
+
+    def get_prefixed(self, prefix: str=None) -> Iterator[Tuple[str, Any]]:
+        """Query scalar config values in config object below a property.
+
+        See :meth:`configaro.get_prefixed` for details.
+
+        """
+        data = self._scoped()._lookup(prefix or '')
+        return _flatten(prefix or '', data)
+
+    def dump(self, outfile: IO[str], prefix: str=None, as_json: bool=False):
+        """Write config values in config object to a file object.
+
+        See :meth:`configaro.dump` for details.
+
+        """
+        if as_json:
+            _dump_json(outfile, self._scoped()._lookup(prefix or ''))
+            return
+        for prop_name, value in self.get_prefixed(prefix):
+            outfile.write(f'{prop_name}={value}\n')
+
+    def put(self, *args: str, **kwargs: str):
+        """Modify config values in config object.
+
+        See :meth:`configaro.put` for details.
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+
+        # Handle passing in a single dict arg.  Its root properties replace
+        # existing ones without checking that they are scalar.
+        if len(args) == 1 and isinstance(args[0], dict):
+            self._apply(list(args[0].items()), check=False)
+            return
+        self._apply(_updates(args, kwargs))
+
+    def put_arguments(self, parser: ArgumentParser, updates: List[str], option: str='--set'):
+        """Modify config values in config object from command line update strings.
+
+        See :meth:`configaro.put_arguments` for details.
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        batch = []
+        for i, update in enumerate(updates):
+            try:
+                parsed = _updates((update,), {})
+            except ConfigUpdateNotValidError:
+                parsed = []
+            # Each update string holds one update, so that failures map back
+            # to the argument holding them.
+            if len(parsed) != 1:
+                parser.error(f'argument {option} #{i + 1}: config update not valid: {update}')
+            batch.extend(parsed)
+        failed = []
+        try:
+            self._apply(batch, failed=failed)
+        except ConfigError as error:
+            if not failed:
+                raise
+            i = failed[0]
+            parser.error(f'argument {option} #{i + 1}: {updates[i]}: {error.message}')
+
+    def override(self, *args: str, **kwargs: str) -> '_Scope':
+        """Temporarily override config values for the current thread or task.
+
+        See :meth:`configaro.override` for details.
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        if len(args) == 1 and isinstance(args[0], dict):
+            return _Scope(self, list(args[0].items()), check=False)
+        return _Scope(self, _updates(args, kwargs))
+
+    def _scoped(self) -> 'Config':
+        """Get initialized config object in effect for the current thread or task.
+
+        Returns:
+            config object, or the config object overriding it in the current scope
+
+        Raises:
+            configaro.ConfigObjectNotInitializedError: if config object has not been initialized
+
+        """
+        if not self.initialized:
+            raise ConfigObjectNotInitializedError()
+        scopes = _SCOPES.get()
+        if scopes is not None and self in scopes:
+            return scopes[self]
+        return self
+
+    def _match(self, parts: List[str]) -> List[str]:
+        """Match config property names against pattern parts.
+
+        Args:
+            parts: config property name pattern parts
+
+        Returns:
+            matching config property names, in order
+
+        """
+        if self._base is None:
+            # Puts update the index in place, so it is built and matched
+            # with the config object lock held.
+            with self._lock:
+                if self._index is None:
+                    self._index = _Index()
+                    for prop_name, value in _dict_items(self._data):
+                        self._index.add(prop_name, value)
+                return self._index.match(parts)
+
+        # Match base properties not replaced by overrides, then overrides.
+        overrides = self._overrides
+        prop_names = []
+        for prop_name in self._base._match(parts):
+            names = prop_name.split('.')
+            if not any('.'.join(names[:i]) in overrides for i in range(1, len(names) + 1)):
+                prop_names.append(prop_name)
+        for override_name, value in overrides.items():
+            prop_names.extend(prop_name for prop_name in _prop_names(override_name, value, len(parts))
+                              if _Index.matches(prop_name.split('.'), parts))
+        return sorted(prop_names)
+
+    def _lookup(self, prop_name: str, **kwargs: str) -> Any:
+        """Get config value identified by config property.
+
+        Args:
+            prop_name: config property name, or empty string for the root config object
+            kwargs: keyword arguments
+
+        Returns:
+            config value
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if property is not found and *default* keyword arg is not present
+
+        """
+        if self._base is None:
+            if not prop_name:
+                return self._data
+            # Remember missing properties, so that repeatedly querying them
+            # with a default value, as done for feature flags, is cheap.
+            # Misses are tagged with the version they were seen at, so that a
+            # miss recorded while a put is in progress is never trusted.
+            #
+            # Reads must scale across threads, including on free-threaded
+            # interpreters, so they never take locks or update shared
+            # counters.  The cache is only written on misses, and a full
+            # cache is replaced rather than evicted from in place.
+            version = self._version
+            misses = self._misses
+            if misses.get(prop_name) == version:
+                return _missing(self._data, prop_name, kwargs)
+            value = _get(self._data, prop_name, default=_MISSING)
+            if self._store is not None:
+                value = self._lookup_store(prop_name, value)
+            if value is _MISSING:
+                if len(misses) >= MISSES_CACHE_SIZE:
+                    misses = self._misses = {}
+                misses[prop_name] = version
+                return _missing(self._data, prop_name, kwargs)
+            return value
+        overrides = self._overrides
+        if not overrides:
+            return self._base._lookup(prop_name, **kwargs)
+        if prop_name in overrides:
+            return overrides[prop_name]
+        parts = prop_name.split('.')
+        for i in range(len(parts) - 1, 0, -1):
+            parent_prop_name = '.'.join(parts[:i])
+            if parent_prop_name in overrides:
+                return _get(overrides[parent_prop_name], '.'.join(parts[i:]), **kwargs)
+        if prop_name and prop_name not in self._prefixes:
+            return self._base._lookup(prop_name, **kwargs)
+
+        # Overrides exist below the property, so merge them into a copy.
+        data = _viewed(self._base._lookup(prop_name))
+        prefix = f'{prop_name}.' if prop_name else ''
+        for override_name, value in overrides.items():
+            if override_name.startswith(prefix):
+                parent_prop_name, _, name = override_name[len(prefix):].rpartition('.')
+                config = _get(data, parent_prop_name) if parent_prop_name else data
+                _dict_setitem(config, name, value)
+        return data
+
+    def _lookup_store(self, prop_name: str, value: Any) -> Any:
+        """Get config value identified by config property from config store.
+
+        Args:
+            prop_name: config property name
+            value: config value found in config data, if any
+
+        Returns:
+            config value, merged with config data for sub config objects
+
+        """
+        if value is not _MISSING and not isinstance(value, dict):
+            return value
+        stored = self._store.get(prop_name, _MISSING)
+        if stored is _MISSING:
+            return value
+        if not isinstance(stored, dict):
+            return stored if value is _MISSING else value
+        return _viewed(stored if value is _MISSING else dict(_merge(stored, value)))
+
+    def _apply(self, updates: List[Tuple[str, Any]], check: bool=True, failed: List[int]=None):
+        """Apply config updates to config object.
+
+        The updates are applied as a batch: if one of them fails, none of
+        them is applied.
+
+        Args:
+            updates: config property names and values
+            check: check that non-dict values do not replace sub config objects
+            failed: index of the update that failed to apply, appended to
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if config property is not found
+            configaro.ConfigPropertyNotScalarError: if config property is not scalar and non-dict value is provided
+
+        """
+        with self._lock:
+            changes = []
+            applied = []
+            # Updates sharing a parent, such as many command line overrides,
+            # resolve it only once.
+            parents = {}
+            # The config data is modified in place, so the values replaced by
+            # a batch, or the overrides, are kept to undo it.
+            if self._base is None:
+                saved = []
+            else:
+                saved = (dict(self._overrides), dict(self._prefixes), set(self._resolved))
+            for i, (prop_name, prop_value) in enumerate(updates):
+                try:
+                    # Sub config objects are copied into views, so that the
+                    # caller's dicts are not shared with the config data.
+                    if isinstance(prop_value, dict):
+                        prop_value = _viewed(prop_value)
+                    if self._base is None:
+                        if check:
+                            old_value = _put(self._data, prop_name, prop_value, saved, parents)
+                            if self._store is not None:
+                                old_value = self._lookup_store(prop_name, old_value)
+                        else:
+                            old_value = self._lookup(prop_name, default=_MISSING)
+                            saved.append((self._data, prop_name, _dict_get(self._data, prop_name, _MISSING)))
+                            _dict_setitem(self._data, prop_name, prop_value)
+                            parents.clear()
+                        if self._index is not None:
+                            if old_value is not _MISSING:
+                                self._index.remove(prop_name, old_value)
+                            self._index.add(prop_name, prop_value)
+                    else:
+                        old_value = self._lookup(prop_name, default=_MISSING)
+                        self._override(prop_name, prop_value, check)
+                        self._resolved.discard(prop_name)
+                except BaseException:
+                    self._restore(saved)
+                    if failed is not None:
+                        failed.append(i)
+                    raise
+                changes.append((prop_name, None if old_value is _MISSING else old_value, prop_value))
+                applied.append((prop_name, prop_value))
+            if changes:
+                # Record resolved config values as the new values of the
+                # updates made to them, and as changes of their own.  A batch
+                # whose config values cannot be resolved is not applied.
+                try:
+                    if self._base is None:
+                        resolved = self._interpolate(changes, saved)
+                    else:
+                        resolved = self._interpolate_overrides(changes)
+                except BaseException:
+                    self._restore(saved)
+                    raise
+                positions = {prop_name: i for i, (prop_name, _, _) in enumerate(changes)}
+                for prop_name, old_value, new_value in resolved:
+                    if prop_name in positions:
+                        i = positions[prop_name]
+                        changes[i] = (prop_name, changes[i][1], new_value)
+                    else:
+                        changes.append((prop_name, old_value, new_value))
+            if applied and self._log is not None:
+                self._log.append(applied, check)
+            if changes:
+                self._commit(changes)
+
+    def _restore(self, saved: Union[list, tuple]):
+        """Undo the updates of a batch that failed to apply.
+
+        Must be called with the config object lock held.
+
+        Args:
+            saved: sub config objects, names and values replaced by the batch, in order, or overrides, override
+                prefixes and resolved overrides of config object with base
+
+        """
+        if self._base is None:
+            for config, name, value in reversed(saved):
+                if value is _MISSING:
+                    _dict_pop(config, name, None)
+                else:
+                    _dict_setitem(config, name, value)
+            self._index = None
+        else:
+            self._overrides, self._prefixes, self._resolved = saved
+        # Misses and accessors seen while the batch was applied are tagged
+        # with the current version, but may no longer be valid.
+        self._typed = None
+        self._misses = {}
+
+    def _commit(self, changes: List[Tuple[str, Any, Any]]):
+        """Commit config changes, creating a new config object version.
+
+        Must be called with the config object lock held.
+
+        Args:
+            changes: config property names, old and new values
+
+        """
+        version = self._version + 1
+        if self._journal is None:
+            from collections import deque
+
+            self._journal = deque(maxlen=JOURNAL_SIZE)
+        journal = self._journal
+        # Sub config objects are recorded as changes of their scalar config
+        # properties, so that records do not keep whole subtrees alive.
+        records = [ConfigChange(version, *leaf_change) for change in changes for leaf_change in _leaf_changes(*change)]
+        for record in records:
+            if len(journal) == JOURNAL_SIZE:
+                self._dropped = journal[0].version
+            journal.append(record)
+        self._misses = {}
+        self._columns = {}
+        self._version = version
+        for listener in self._listeners:
+            listener(records)
+
+    def _after_fork(self):
+        """Reset config object locks, caches and listeners in a forked child process."""
+        # Locks may have been held by threads of the parent process, and
+        # listeners serve threads and event loops that do not exist here.
+        self._lock = threading.Lock()
+        self._listeners = ()
+        self._misses = {}
+        self._columns = {}
+        if self._log is not None:
+            self._log.after_fork()
+
+    def _listen(self, listener: Callable[[List[ConfigChange]], None]):
+        """Add config change listener.
+
+        Listeners are called with the change records of each new config object
+        version, in order, while the config object lock is held.  They must
+        return quickly and must not modify the config object.
+
+        Args:
+            listener: config change listener
+
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def _unlisten(self, listener: Callable[[List[ConfigChange]], None]):
+        """Remove config change listener.
+
+        Args:
+            listener: config change listener
+
+        """
+        with self._lock:
+            self._listeners = tuple(item for item in self._listeners if item != listener)
+
+    def _build(self) -> Tuple[dict, Union[_Interpolation, None]]:
+        """Build config data from the config modules of the config object.
+
+        Returns:
+            config data, and its interpolation if any config values refer to others
+
+        """
+        config_package, locals_path, locals_env_var = self._sources
+        with _TRACER.span('build', package=config_package):
+            with _TRACER.span('find'):
+                module_paths = _config_module_paths(config_package, locals_path, locals_env_var)
+                fragment_paths = _config_fragment_paths(config_package)
+            configs = [_load(module_paths[0])]
+            configs.extend(_load_fragments(fragment_paths))
+            configs.extend(_load(path) for path in module_paths[1:])
+            with _TRACER.span('merge', configs=len(configs)) as span:
+                data = _viewed(_reduce(configs), _Data)
+                if span:
+                    span.set(values=sum(1 for _ in _flatten('', data)))
+            if self._log is not None:
+                with _TRACER.span('replay', path=self._log.path) as span:
+                    self._log.replay(data)
+                    if span:
+                        span.set(overrides=len(self._log._overrides))
+            with _TRACER.span('interpolate') as span:
+                interpolation = _Interpolation()
+                for prop_name, value in _flatten('', data):
+                    interpolation.add(prop_name, value)
+                if span:
+                    span.set(templates=len(interpolation.templates))
+                if not interpolation.templates:
+                    return data, None
+                interpolation.resolve(data, list(interpolation.templates))
+            return data, interpolation
+
+    def _interpolate(self, updates: List[Tuple[str, Any, Any]],
+                     undo: List[Tuple[dict, str, Any]]=None) -> List[Tuple[str, Any, Any]]:
+        """Resolve config values referring to updated config values again.
+
+        Must be called with the config object lock held, after the updates
+        have been applied to the config data.  If a config value cannot be
+        resolved, the templates are left as they were before the updates.
+
+        Args:
+            updates: config property names, old and new values
+            undo: sub config objects, names and values replaced by resolved config values, appended to
+
+        Returns:
+            config property names, old and new values of resolved config values
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if a referenced config property is not found
+            configaro.ConfigReferenceNotValidError: if config values refer to each other in a cycle
+
+        """
+        interpolation = self._interpolation
+        added = []
+        discarded = []
+        for prop_name, old_value, new_value in updates:
+            if interpolation is not None:
+                discarded.extend(interpolation.discard(prop_name, isinstance(old_value, dict)))
+            for name, value in _flatten(prop_name, new_value):
+                if _is_template(value):
+                    if interpolation is None:
+                        interpolation = self._interpolation = _Interpolation()
+                    interpolation.add(name, value)
+                    added.append(name)
+        if interpolation is None or not interpolation.templates:
+            return []
+        subtrees = {prop_name for prop_name, old_value, new_value in updates
+                    if isinstance(old_value, dict) or isinstance(new_value, dict)}
+        prop_names = interpolation.dependents((prop_name for prop_name, _, _ in updates), subtrees)
+        prop_names.update(added)
+        old_values = {prop_name: _get(self._data, prop_name, default=None) for prop_name in prop_names}
+        try:
+            resolved = interpolation.resolve(self._data, prop_names, undo)
+        except ConfigError:
+            for prop_name in added:
+                interpolation.discard(prop_name, False)
+            for prop_name, template in discarded:
+                interpolation.add(prop_name, template)
+            raise
+        changes = []
+        for prop_name, value in resolved:
+            old_value = old_values[prop_name]
+            if self._index is not None:
+                self._index.remove(prop_name, old_value)
+                self._index.add(prop_name, value)
+            changes.append((prop_name, old_value, value))
+        return changes
+
+    def _interpolate_overrides(self, updates: List[Tuple[str, Any, Any]]) -> List[Tuple[str, Any, Any]]:
+        """Resolve config values of the root config object referring to overridden config values again.
+
+        Resolved config values are recorded as overrides of the config object
+        with base, unless it overrides them, or config objects above them,
+        itself.  Must be called with the config object lock held, after the
+        updates have been applied.
+
+        Args:
+            updates: config property names, old and new values
+
+        Returns:
+            config property names, old and new values of resolved config values
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if a referenced config property is not found
+            configaro.ConfigReferenceNotValidError: if config values refer to each other in a cycle
+
+        """
+        root = self._base
+        while root._base is not None:
+            root = root._base
+        interpolation = root._interpolation
+        if interpolation is None:
+            return []
+        subtrees = {prop_name for prop_name, old_value, new_value in updates
+                    if isinstance(old_value, dict) or isinstance(new_value, dict)}
+        prop_names = interpolation.dependents((prop_name for prop_name, _, _ in updates), subtrees)
+        changes = []
+        for prop_name in interpolation._order(prop_names):
+            parts = prop_name.split('.')
+            names = ['.'.join(parts[:i]) for i in range(1, len(parts) + 1)]
+            if any(name in self._overrides and name not in self._resolved for name in names):
+                continue
+            old_value = self._lookup(prop_name, default=None)
+            value = _render(self._lookup, interpolation.templates[prop_name][0])
+            self._override(prop_name, value, False)
+            self._resolved.add(prop_name)
+            changes.append((prop_name, old_value, value))
+        return changes
+
+    def _override(self, prop_name: str, prop_value: Any, check: bool):
+        """Record config override in config object with base.
+
+        Args:
+            prop_name: config property name
+            prop_value: config value
+            check: check that config property exists and that non-dict values do not replace sub config objects
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if config property is not found
+            configaro.ConfigPropertyNotScalarError: if config property is not scalar and non-dict value is provided
+
+        """
+        parent_prop_name, _, name = prop_name.rpartition('.')
+        config = self._lookup(parent_prop_name) if parent_prop_name else self._lookup('')
+        if check:
+            old_value = _dict_get(config, name, _MISSING) if isinstance(config, dict) else _MISSING
+            if old_value is _MISSING:
+                raise ConfigPropertyNotFoundError(config, prop_name)
+            if isinstance(old_value, dict) and not isinstance(prop_value, dict):
+                raise ConfigPropertyNotScalarError(config, name)
+
+        # An override inside an overridden sub config object updates a copy of it.
+        parts = prop_name.split('.')
+        for i in range(len(parts) - 1, 0, -1):
+            ancestor_prop_name = '.'.join(parts[:i])
+            if ancestor_prop_name in self._overrides:
+                value = _viewed(self._overrides[ancestor_prop_name])
+                _put(value, '.'.join(parts[i:]), prop_value)
+                prop_name, prop_value = ancestor_prop_name, value
+                break
+
+        # Overrides below the overridden property are superseded by it.
+        prefix = f'{prop_name}.'
+        for override_name in [name for name in self._overrides if name.startswith(prefix)]:
+            self._discard(override_name)
+        if prop_name not in self._overrides:
+            parts = prop_name.split('.')
+            for i in range(1, len(parts)):
+                ancestor_prop_name = '.'.join(parts[:i])
+                self._prefixes[ancestor_prop_name] = self._prefixes.get(ancestor_prop_name, 0) + 1
+        self._overrides[prop_name] = prop_value
+
+    def _discard(self, prop_name: str):
+        """Discard config override in config object with base.
+
+        Args:
+            prop_name: config property name
+
+        """
+        del self._overrides[prop_name]
+        parts = prop_name.split('.')
+        for i in range(1, len(parts)):
+            ancestor_prop_name = '.'.join(parts[:i])
+            count = self._prefixes[ancestor_prop_name] - 1
+            if count:
+                self._prefixes[ancestor_prop_name] = count
+            else:
+                del self._prefixes[ancestor_prop_name]
+
+
+_CONFIGS = set()
+_CONFIG = Config()
+
+
+def _after_fork():
+    """Reset config objects in a forked child process."""
+    _FILE_VALUES.after_fork()
+    for config_ref in list(_CONFIGS):
+        config = config_ref()
+        if config is not None:
+            config._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+class ConfigStore:
+    """Config store class.
+
+    Opens a config store file written by :meth:`configaro.compile_store` with
+    a read-only memory map.  Config values are found by binary search over the
+    sorted property names and decoded on demand::
+
+        store = ConfigStore('/var/lib/my_project/routes.cfgs')
+        backend = store.get('routes.example_com.backend')
+
+    Use it as a layer below the config modules with the *store_path* argument
+    of :meth:`configaro.init`.
+    """
+
+    def __init__(self, path: str):
+        """Initialize new ConfigStore object.
+
+        Args:
+            path: path of config store file
+
+        Raises:
+            configaro.ConfigModuleNotValidError: if file is not a config store
+
+        """
+        import mmap
+        from json import JSONDecoder
+
+        self.path = path
+        self._decode = JSONDecoder().decode
+        with open(path, 'rb') as infile:
+            self._mmap = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if view[:8] != _STORE_MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ConfigModuleNotValidError(path)
+        count = view[8:16].cast('Q')[0]
+        offsets_size = 8 * (count + 1)
+        self._count = count
+        self._key_offsets = view[16:16 + offsets_size].cast('Q')
+        self._value_offsets = view[16 + offsets_size:16 + 2 * offsets_size].cast('Q')
+        slots_start = 16 + 2 * offsets_size
+        self._slots = view[slots_start:slots_start + 8 * _store_slots(count)].cast('Q')
+        self._keys_start = slots_start + 8 * _store_slots(count)
+        self._values_start = self._keys_start + self._key_offsets[count]
+        # A config store replaced by a reload may still be queried by other
+        # threads, so it is closed when it is no longer used.
+        self._finalizer = finalize(self, _close_store, self._mmap,
+                                   (self._key_offsets, self._value_offsets, self._slots))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, prop_name: str) -> bool:
+        return self.get(prop_name, _MISSING) is not _MISSING
+
+    def get(self, prop_name: str, default: Any=None) -> Any:
+        """Get config value identified by config property.
+
+        Sub config objects are built from all the config values below them.
+
+        Args:
+            prop_name: config property name
+            default: value returned if config property is not found
+
+        Returns:
+            config value
+
+        """
+        key = prop_name.encode()
+        index = self._find(key)
+        if index is not None:
+            return self._value(index)
+        data = {}
+        for name, value in self.items(prop_name):
+            config = data
+            *parents, name = name[len(prop_name) + 1:].split('.')
+            for parent in parents:
+                config = config.setdefault(parent, {})
+            config[name] = value
+        return data or default
+
+    def items(self, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Get names and values of scalar config properties below a config property.
+
+        Args:
+            prefix: config property name
+
+        Yields:
+            config property names and values, in name order
+
+        """
+        key = prefix.encode()
+        start, stop = self._bisect(key + b'.'), self._bisect(key + b'/')
+        for index in range(start, stop):
+            yield self._key(index).decode(), self._value(index)
+
+    def close(self):
+        """Close the memory map of the config store file."""
+        self._finalizer()
+
+    def _find(self, key: bytes) -> Union[int, None]:
+        from zlib import crc32
+
+        mmap, offsets, start, slots = self._mmap, self._key_offsets, self._keys_start, self._slots
+        slot = crc32(key) % len(slots)
+        while slots[slot]:
+            index = slots[slot] - 1
+            if mmap[start + offsets[index]:start + offsets[index + 1]] == key:
+                return index
+            slot = (slot + 1) % len(slots)
+        return None
+
+    def _bisect(self, key: bytes) -> int:
+        mmap, offsets, start = self._mmap, self._key_offsets, self._keys_start
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if mmap[start + offsets[middle]:start + offsets[middle + 1]] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys_start
+        return self._mmap[start + self._key_offsets[index]:start + self._key_offsets[index + 1]]
+
+    def _value(self, index: int) -> Any:
+        start = self._values_start
+        return self._decode(self._mmap[start + self._value_offsets[index]:start + self._value_offsets[index + 1]].decode())
+
+
+def _store_slots(count: int) -> int:
+    """Get number of hash table slots of config store holding *count* config values."""
+    return 2 * count + 1
+
+
+def _close_store(mapping: mmap, views: Tuple[memoryview, ...]):
+    """Close the memory map of a config store file, releasing the views of it first."""
+    for view in views:
+        view.release()
+    mapping.close()
+
+
+class ConfigServer:
+    """Config server class.
+
+    The server speaks a compact framed protocol.  Each frame is a 4 byte big
+    endian length followed by a JSON document of that length.  Clients send
+    request frames and receive one response frame per request:
+
+    - ``{"op": "get", "names": [...]}`` queries any number of config
+      properties at once, the empty name being the root config object, and
+      responds with ``{"version": ..., "values": [...], "missing": [...]}``,
+      where *missing* lists the indexes of names not found.
+    - ``{"op": "put", "args": [...], "kwargs": {...}}`` calls
+      :meth:`configaro.put` and responds with ``{"version": ...}``.
+    - ``{"op": "watch"}`` responds with ``{"version": ...}`` and then pushes a
+      ``{"version": ..., "changes": [[name, old, new], ...]}`` frame for each
+      new config object version, until the connection is closed.
+
+    Failed requests, and requests that are not valid, are responded to with
+    ``{"error": {...}}``, holding the type name, message and properties of the
+    config error raised.
+    """
+
+    def __init__(self, path: str, config: Config=None):
+        """Initialize new ConfigServer object.
+
+        Args:
+            path: path of the Unix domain socket to create
+            config: config object to serve, the default config object if not provided
+
+        """
+        self.path = path
+        self.config = _CONFIG if config is None else config
+        self._socket = None
+        self._connections = set()
+        self._watchers = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'ConfigServer':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Start serving the config object in background threads."""
+        import socket
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(self.path)
+        self._socket.listen()
+        threading.Thread(target=self._accept, name='configaro-server', daemon=True).start()
+
+    def close(self):
+        """Stop serving the config object and close all connections."""
+        sock, self._socket = self._socket, None
+        with self._lock:
+            connections = [sock] if sock is not None else []
+            connections.extend(self._connections)
+            for watcher in self._watchers:
+                watcher.put(None)
+        for connection in connections:
+            _close(connection)
+        if sock is not None and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _accept(self):
+        sock = self._socket
+        while True:
+            try:
+                connection, _ = sock.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._connections.add(connection)
+            threading.Thread(target=self._handle, args=(connection,), name='configaro-connection', daemon=True).start()
+
+    def _handle(self, connection: socket):
+        try:
+            while True:
+                try:
+                    request = _recv_frame(connection)
+                except ValueError as error:
+                    # The frame was received whole, so the connection is kept.
+                    _send_frame(connection, self._failed(ConfigError(f'config request not valid: {error}')))
+                    continue
+                if request is None:
+                    break
+                if isinstance(request, dict) and request.get('op') == 'watch':
+                    self._watch(connection)
+                    break
+                _send_frame(connection, self._respond(request))
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._connections.discard(connection)
+            _close(connection)
+
+    def _respond(self, request: Any) -> dict:
+        config = self.config
+        try:
+            op = request.get('op') if isinstance(request, dict) else None
+            if op == 'get':
+                names = request.get('names')
+                if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+                    raise ConfigError(f'config request not valid: {request}')
+                version = config.version
+                values = [config.get(name, default=_MISSING) if name else config.get() for name in names]
+                missing = [i for i, value in enumerate(values) if value is _MISSING]
+                for i in missing:
+                    values[i] = None
+                return {'version': version, 'values': values, 'missing': missing}
+            if op == 'put':
+                args, kwargs = request.get('args', []), request.get('kwargs', {})
+                if (not isinstance(args, list) or not all(isinstance(arg, (str, dict)) for arg in args)
+                        or not isinstance(kwargs, dict)):
+                    raise ConfigError(f'config request not valid: {request}')
+                config.put(*args, **kwargs)
+                return {'version': config.version}
+            raise ConfigError(f'config request not valid: {request}')
+        except ConfigError as error:
+            return self._failed(error)
+
+    @staticmethod
+    def _failed(error: ConfigError) -> dict:
+        attrs = {name: getattr(error, name) for name in ('prop_name', 'update') if hasattr(error, name)}
+        return {'error': {'type': type(error).__name__, 'message': error.message, 'attrs': attrs}}
+
+    def _watch(self, connection: socket):
+        from queue import SimpleQueue
+
+        batches = SimpleQueue()
+        with self._lock:
+            self._watchers.add(batches)
+        self.config._listen(batches.put)
+        try:
+            _send_frame(connection, {'version': self.config.version})
+            while True:
+                records = batches.get()
+                if records is None:
+                    break
+                changes = [[record.prop_name, record.old_value, record.new_value] for record in records]
+                _send_frame(connection, {'version': records[0].version, 'changes': changes})
+        finally:
+            self.config._unlisten(batches.put)
+            with self._lock:
+                self._watchers.discard(batches)
+
+
+class ConfigClient:
+    """Config client class.
+
+    Queries a config object served by :meth:`configaro.serve`.  Connections
+    to the server are pooled and reused across queries from any thread::
+
+        client = ConfigClient('/run/my_project/config.sock')
+        level = client.get('log.level')
+
+    Unless *cache* is False, queried config values, and misses, are kept in a
+    local read through cache of the ``CLIENT_CACHE_SIZE`` most recently used
+    config properties.  The client watches the server for changes over a
+    dedicated connection, and evicts cached config values as soon as they
+    change.  If that connection is lost the cache is disabled.
+    """
+
+    def __init__(self, path: str, pool_size: int=4, cache: bool=True):
+        """Initialize new ConfigClient object.
+
+        Args:
+            path: path of the config server Unix domain socket
+            pool_size: maximum number of idle connections kept open
+            cache: cache queried config values locally
+
+        """
+        self.path = path
+        self.pool_size = pool_size
+        self._pool = []
+        self._lock = threading.Lock()
+        self._cache = None
+        self._version = 0
+        self._watcher = None
+        if cache:
+            self._start_cache()
+
+    def __enter__(self) -> 'ConfigClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, *prop_names: str, **kwargs: str) -> Any:
+        """Query config values in served config object.
+
+        Sub config objects are returned as plain dicts.  Missing config values
+        are queried from the server in a single request.  See
+        :meth:`configaro.get` for details.
+
+        """
+        if not prop_names or len(prop_names) == 1 and prop_names[0] is None:
+            prop_names = ('',)
+        cache = self._cache
+        values = [_MISSING] * len(prop_names)
+        if cache is not None:
+            # The cache is kept in least recently used order, so hits are
+            # moved to its end.
+            with self._lock:
+                for i, name in enumerate(prop_names):
+                    value = cache.pop(name, _MISSING)
+                    if value is not _MISSING:
+                        values[i] = cache[name] = value
+        names = [name for name, value in zip(prop_names, values) if value is _MISSING]
+        if names:
+            response = self._request({'op': 'get', 'names': names})
+            fetched = dict(zip(names, response['values']))
+            for i in response['missing']:
+                fetched[names[i]] = _NOT_FOUND
+            with self._lock:
+                if cache is not None and self._cache is cache and response['version'] >= self._version:
+                    for name, value in fetched.items():
+                        cache.pop(name, None)
+                        cache[name] = value
+                    while len(cache) > CLIENT_CACHE_SIZE:
+                        del cache[next(iter(cache))]
+            values = [fetched[name] if value is _MISSING else value for name, value in zip(prop_names, values)]
+        for i, value in enumerate(values):
+            if value is _NOT_FOUND:
+                values[i] = _missing(None, prop_names[i], kwargs)
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def put(self, *args: str, **kwargs: str):
+        """Modify config values in served config object.
+
+        See :meth:`configaro.put` for details.
+
+        """
+        if len(args) == 1 and isinstance(args[0], dict):
+            prop_names = list(args[0])
+        else:
+            prop_names = [prop_name for prop_name, _ in _updates(args, kwargs)]
+        response = self._request({'op': 'put', 'args': args, 'kwargs': kwargs})
+        self._evict(response['version'], prop_names)
+
+    def watch(self) -> Iterator[ConfigChange]:
+        """Watch served config object for changes.
+
+        All changes made after this method returns are reported.
+
+        Returns:
+            iterator of config change records, ending when the connection is closed
+
+        """
+        connection = self._connect()
+        try:
+            _send_frame(connection, {'op': 'watch'})
+            _recv_frame(connection)
+        except BaseException:
+            _close(connection)
+            raise
+        return self._changes(connection)
+
+    def _changes(self, connection: socket) -> Iterator[ConfigChange]:
+        try:
+            while True:
+                message = _recv_frame(connection)
+                if message is None:
+                    return
+                for change in message['changes']:
+                    yield ConfigChange(message['version'], *change)
+        finally:
+            _close(connection)
+
+    def close(self):
+        """Close all connections to the server."""
+        with self._lock:
+            connections, self._pool = self._pool, []
+            self._cache = None
+            if self._watcher is not None:
+                connections.append(self._watcher)
+                self._watcher = None
+        for connection in connections:
+            _close(connection)
+
+    def _connect(self) -> socket:
+        import socket
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(self.path)
+        except OSError:
+            connection.close()
+            raise
+        return connection
+
+    def _request(self, request: dict) -> dict:
+        with self._lock:
+            connection = self._pool.pop() if self._pool else None
+        if connection is None:
+            connection = self._connect()
+        try:
+            _send_frame(connection, request)
+            response = _recv_frame(connection)
+            if response is None:
+                raise ConnectionResetError(f'config server closed connection: {self.path}')
+        except BaseException:
+            _close(connection)
+            raise
+        with self._lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(connection)
+                connection = None
+        if connection is not None:
+            _close(connection)
+        if 'error' in response:
+            raise _error(response['error'])
+        return response
+
+    def _start_cache(self):
+        connection = self._connect()
+        _send_frame(connection, {'op': 'watch'})
+        self._version = _recv_frame(connection)['version']
+        self._cache = {}
+        self._watcher = connection
+        threading.Thread(target=self._watch_cache, args=(connection,), name='configaro-client', daemon=True).start()
+
+    def _watch_cache(self, connection: socket):
+        try:
+            while True:
+                message = _recv_frame(connection)
+                if message is None:
+                    break
+                self._evict(message['version'], [change[0] for change in message['changes']])
+        except OSError:
+            pass
+        with self._lock:
+            self._cache = None
+
+    def _evict(self, version: int, prop_names: List[str]):
+        with self._lock:
+            self._version = max(self._version, version)
+            cache = self._cache
+            if cache is None:
+                return
+            for name in [name for name in cache if any(_related(name, prop_name) for prop_name in prop_names)]:
+                del cache[name]
+
+
+def _send_frame(connection: socket, message: dict):
+    """Send config protocol frame.
+
+    Args:
+        connection: socket connection
+        message: message to send
+
+    """
+    from json import dumps
+
+    data = dumps(message, separators=(',', ':'), default=_json_default).encode()
+    connection.sendall(len(data).to_bytes(4, 'big') + data)
+
+
+def _footprint(prop_name: str, value: Any, seen: set, scalars: dict) -> ConfigFootprint:
+    """Measure the memory footprint of config value.
+
+    Args:
+        prop_name: config property name
+        value: config value
+        seen: ids of objects counted before, updated
+        scalars: scalar config values counted before, by type and value, updated
+
+    Returns:
+        config footprint
+
+    """
+    from sys import getsizeof
+
+    size = nodes = leaves = duplicates = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        counted = id(value) in seen
+        if not counted:
+            seen.add(id(value))
+            size += getsizeof(value)
+        if isinstance(value, dict):
+            nodes += 1
+            for key, child in _dict_items(value):
+                if id(key) not in seen:
+                    seen.add(id(key))
+                    size += getsizeof(key)
+                stack.append(child)
+            continue
+        leaves += 1
+        if counted:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    size += getsizeof(item)
+            continue
+        try:
+            if scalars.setdefault((type(value), value), value) is not value:
+                duplicates += 1
+        except TypeError:
+            pass
+    return ConfigFootprint(prop_name, size, nodes, leaves, duplicates)
+
+
+def _json_default(value: Any) -> Any:
+    """Get JSON encodable form of config value.
+
+    Args:
+        value: config value not encodable as JSON
+
+    Returns:
+        string form of config value
+
+    """
+    return str(value)
+
+
+def _recv_frame(connection: socket) -> Union[dict, None]:
+    """Receive config protocol frame.
+
+    Args:
+        connection: socket connection
+
+    Returns:
+        message received, or None if the connection was closed
+
+    """
+    from json import loads
+
+    header = _recv_exactly(connection, 4)
+    if header is None:
+        return None
+    data = _recv_exactly(connection, int.from_bytes(header, 'big'))
+    return None if data is None else loads(data)
+
+
+def _recv_exactly(connection: socket, size: int) -> Union[bytes, None]:
+    """Receive an exact number of bytes.
+
+    Args:
+        connection: socket connection
+        size: number of bytes
+
+    Returns:
+        bytes received, or None if the connection was closed
+
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            return None
+        data.extend(chunk)
+    return bytes(data)
+
+
+def _close(connection: socket):
+    """Shut down and close socket connection, waking any thread blocked on it.
+
+    Args:
+        connection: socket connection
+
+    """
+    import socket
+
+    try:
+        connection.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    connection.close()
+
+
+def _error(error: Dict[str, Any]) -> ConfigError:
+    """Build config error from config protocol error.
+
+    Args:
+        error: config protocol error
+
+    Returns:
+        config error
+
+    """
+    attrs = error.get('attrs', {})
+    if error.get('type') == 'ConfigPropertyNotFoundError':
+        return ConfigPropertyNotFoundError(None, attrs.get('prop_name'))
+    if error.get('type') == 'ConfigPropertyNotScalarError':
+        return ConfigPropertyNotScalarError(None, attrs.get('prop_name'))
+    if error.get('type') == 'ConfigUpdateNotValidError':
+        return ConfigUpdateNotValidError(attrs.get('update'))
+    if error.get('type') == 'ConfigObjectNotInitializedError':
+        return ConfigObjectNotInitializedError()
+    return ConfigError(error.get('message'))
+
+
+def _related(prop_name: str, other_prop_name: str) -> bool:
+    """Check if one config property contains the other.
+
+    Args:
+        prop_name: config property name, or empty string for the root config object
+        other_prop_name: config property name, or empty string for the root config object
+
+    Returns:
+        True if the config properties are the same, or one is below the other
+
+    """
+    if not prop_name or not other_prop_name or prop_name == other_prop_name:
+        return True
+    return prop_name.startswith(f'{other_prop_name}.') or other_prop_name.startswith(f'{prop_name}.')
+
+
+class _OverrideLog:
+    """Override log class.
+
+    Appends config updates to an override log file of JSON records, one per
+    line, each holding the *check* flag and updates of a put.  Records are
+    written and synced to disk by a background thread, in groups, so that
+    puts never wait for the disk.  The current overrides are also kept in
+    memory, so that the override log file can be replaced by a snapshot of
+    them, one record per overridden config property.
+    """
+
+    __slots__ = ('path', '_overrides', '_records', '_pending', '_synced', '_cond', '_file', '_thread')
+
+    def __init__(self, path: str):
+        """Initialize new _OverrideLog object.
+
+        Args:
+            path: path to override log file
+
+        """
+        self.path = path
+        self._overrides = {}
+        self._records = 0
+        self._pending = []
+        self._synced = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._file = None
+        self._thread = None
+
+    def replay(self, data: dict):
+        """Replay the override log on config data.
+
+        Updates of config properties that are not found, or no longer valid,
+        are dropped.  A record torn by a crash while it was written ends the
+        override log file and is truncated.
+
+        Args:
+            data: config data
+
+        """
+        from json import loads
+
+        # Records are neither appended nor written while the override log
+        # file is read and truncated, so that none is dropped.
+        with self._cond:
+            while (self._pending or self._synced) and self._thread is not None:
+                self._cond.wait()
+            self._overrides = {}
+            self._records = 0
+            end = 0
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as infile:
+                    for line in infile:
+                        if not line.endswith(b'\n'):
+                            break
+                        check, updates = loads(line)
+                        for prop_name, prop_value in updates:
+                            try:
+                                if isinstance(prop_value, dict):
+                                    prop_value = _viewed(prop_value)
+                                if check:
+                                    _put(data, prop_name, prop_value)
+                                else:
+                                    _dict_setitem(data, prop_name, prop_value)
+                            except ConfigError:
+                                continue
+                            self._record(prop_name, prop_value, check)
+                        self._records += 1
+                        end += len(line)
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.truncate(end)
+        if self._records > LOG_COMPACT_RECORDS:
+            self.compact()
+
+    def append(self, updates: List[Tuple[str, Any]], check: bool):
+        """Append config updates of a put to the override log.
+
+        Args:
+            updates: config property names and values
+            check: check that non-dict values do not replace sub config objects
+
+        """
+        from json import dumps
+
+        record = dumps([int(check), updates], separators=(',', ':'), default=_json_default).encode() + b'\n'
+        with self._cond:
+            for prop_name, prop_value in updates:
+                self._record(prop_name, prop_value, check)
+            self._pending.append(record)
+            if self._thread is None:
+                import atexit
+
+                self._thread = threading.Thread(target=self._write, name='configaro-log', daemon=True)
+                self._thread.start()
+                atexit.register(self.sync)
+            self._cond.notify_all()
+
+    def sync(self):
+        """Wait until appended records are synced to disk."""
+        with self._cond:
+            while (self._pending or self._synced) and self._thread is not None:
+                self._cond.wait()
+
+    def compact(self):
+        """Replace the override log file with a snapshot of the current overrides."""
+        from json import dumps
+
+        # Appended records are already part of the snapshot, so drop them.
+        # Records appended while the snapshot is written are kept pending.
+        with self._cond:
+            while self._synced:
+                self._cond.wait()
+            snapshot = list(self._overrides.items())
+            self._pending = []
+            self._synced = len(snapshot) or 1
+        try:
+            temp_path = f'{self.path}.tmp'
+            with open(temp_path, 'wb') as outfile:
+                for prop_name, (prop_value, check) in snapshot:
+                    outfile.write(dumps([int(check), [[prop_name, prop_value]]], separators=(',', ':'),
+                                        default=_json_default).encode() + b'\n')
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            os.replace(temp_path, self.path)
+        finally:
+            with self._cond:
+                if self._file is not None:
+                    self._file.close()
+                self._file = open(self.path, 'ab')
+                self._records = len(snapshot)
+                self._synced = 0
+                self._cond.notify_all()
+
+    def after_fork(self):
+        """Reset the override log in a forked child process.
+
+        Records pending in the parent process are left to it to write.
+        """
+        self._cond = threading.Condition(threading.Lock())
+        self._pending = []
+        self._synced = 0
+        self._thread = None
+
+    def _record(self, prop_name: str, prop_value: Any, check: bool):
+        # Overrides of config properties below an overridden config property
+        # are superseded by it, and overrides are replayed in order.
+        overrides = self._overrides
+        prefix = f'{prop_name}.'
+        for name in [name for name in overrides if name.startswith(prefix)]:
+            del overrides[name]
+        overrides.pop(prop_name, None)
+        overrides[prop_name] = (prop_value, check)
+
+    def _write(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                records, self._pending = self._pending, []
+                # Keep sync() waiting until the records taken are synced.
+                self._synced = len(records)
+                outfile = self._file
+            try:
+                outfile.write(b''.join(records))
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            except BaseException:
+                # Let the next append start a new thread, and sync() return.
+                with self._cond:
+                    self._synced = 0
+                    self._thread = None
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._synced = 0
+                self._records += len(records)
+                compact = self._records > LOG_COMPACT_RECORDS
+                self._cond.notify_all()
+            if compact:
+                self.compact()
+
+
+class _Interpolation:
+    """Config value interpolation class.
+
+    Keeps the templates of config values referring to other config values and
+    the graph of their references, so that only the config values depending
+    on modified config values need to be resolved again.
+    """
+
+    __slots__ = ('templates', 'references')
+
+    def __init__(self):
+        # Template config property names to templates and referenced names,
+        # and referenced config property names to template names.
+        self.templates = {}
+        self.references = {}
+
+    def add(self, prop_name: str, value: Any):
+        """Add config value to interpolation, if it is a template.
+
+        Args:
+            prop_name: config property name
+            value: config value
+
+        """
+        if not _is_template(value):
+            return
+        import re
+
+        names = tuple(match.group(1) for match in re.finditer(_REFERENCE_PATTERN, value) if match.group(1))
+        self.templates[prop_name] = (value, names)
+        for name in names:
+            self.references.setdefault(name, set()).add(prop_name)
+
+    def discard(self, prop_name: str, subtree: bool) -> List[Tuple[str, str]]:
+        """Discard templates of config property from interpolation.
+
+        Args:
+            prop_name: config property name
+            subtree: also discard the templates of config properties below it
+
+        Returns:
+            discarded template config property names and templates
+
+        """
+        prop_names = [prop_name] if prop_name in self.templates else []
+        if subtree:
+            prefix = f'{prop_name}.'
+            prop_names.extend(name for name in self.templates if name.startswith(prefix))
+        discarded = []
+        for name in prop_names:
+            template, references = self.templates.pop(name)
+            for reference in references:
+                dependents = self.references[reference]
+                dependents.discard(name)
+                if not dependents:
+                    del self.references[reference]
+            discarded.append((name, template))
+        return discarded
+
+    def dependents(self, prop_names: Iterator[str], subtrees: set) -> set:
+        """Get templates depending on config properties, directly or not.
+
+        Args:
+            prop_names: config property names
+            subtrees: config property names of sub config objects among them
+
+        Returns:
+            template config property names
+
+        """
+        pending = list(prop_names)
+        found = set()
+        while pending:
+            prop_name = pending.pop()
+            parts = prop_name.split('.')
+            for i in range(len(parts), 0, -1):
+                for name in self.references.get('.'.join(parts[:i]), ()):
+                    if name not in found:
+                        found.add(name)
+                        pending.append(name)
+            if prop_name in subtrees:
+                prefix = f'{prop_name}.'
+                for reference, names in self.references.items():
+                    if reference.startswith(prefix):
+                        pending.extend(name for name in names - found)
+                        found.update(names)
+        return found
+
+    def resolve(self, data: dict, prop_names: Iterator[str],
+                undo: List[Tuple[dict, str, Any]]=None) -> List[Tuple[str, Any]]:
+        """Resolve templates in config data, in dependency order.
+
+        Args:
+            data: config data
+            prop_names: template config property names
+            undo: sub config objects, names and values replaced by resolved config values, appended to
+
+        Returns:
+            template config property names and resolved config values
+
+        Raises:
+            configaro.ConfigPropertyNotFoundError: if a referenced config property is not found
+            configaro.ConfigReferenceNotValidError: if templates refer to each other in a cycle
+
+        """
+        resolved = []
+        for prop_name in self._order(prop_names):
+            value = _render(lambda name: _get(data, name), self.templates[prop_name][0])
+            _assign(data, prop_name, value, undo)
+            resolved.append((prop_name, value))
+        return resolved
+
+    def _order(self, prop_names: Iterator[str]) -> List[str]:
+        from bisect import bisect_left
+
+        selected = sorted(prop_names)
+        selected_set = set(selected)
+
+        def depends_on(prop_name: str) -> Iterator[str]:
+            for reference in self.templates[prop_name][1]:
+                parts = reference.split('.')
+                parents = ['.'.join(parts[:i]) for i in range(len(parts), 0, -1)]
+                yield from (parent for parent in parents if parent in selected_set)
+                start = bisect_left(selected, f'{reference}.')
+                yield from selected[start:bisect_left(selected, f'{reference}/', start)]
+
+        # Depth first search, ordering templates after those they refer to.
+        order = []
+        states = {}
+        for prop_name in selected:
+            if prop_name in states:
+                continue
+            states[prop_name] = False
+            stack = [(prop_name, depends_on(prop_name))]
+            while stack:
+                name, dependencies = stack[-1]
+                for dependency in dependencies:
+                    state = states.get(dependency)
+                    if state is None:
+                        states[dependency] = False
+                        stack.append((dependency, depends_on(dependency)))
+                        break
+                    if state is False:
+                        cycle = [entry[0] for entry in stack]
+                        raise ConfigReferenceNotValidError(cycle[cycle.index(dependency):] + [dependency])
+                else:
+                    stack.pop()
+                    states[name] = True
+                    order.append(name)
+        return order
+
+
+def _is_template(value: Any) -> bool:
+    """Check if config value is a template referring to other config values.
+
+    Args:
+        value: config value
+
+    Returns:
+        True if config value is a string containing ``${``
+
+    """
+    return isinstance(value, str) and '${' in value
+
+
+def _render(lookup: Callable[[str], Any], template: str) -> Any:
+    """Render template with the config values it refers to.
+
+    Args:
+        lookup: config value lookup by config property name
+        template: template config value
+
+    Returns:
+        referenced config value if template is a single reference, otherwise formatted template
+
+    Raises:
+        configaro.ConfigPropertyNotFoundError: if a referenced config property is not found
+
+    """
+    import re
+
+    match = re.fullmatch(_REFERENCE_PATTERN, template)
+    if match and match.group(1):
+        return _viewed(lookup(match.group(1)))
+    return re.sub(_REFERENCE_PATTERN, lambda match: str(lookup(match.group(1))) if match.group(1) else '${',
+                  template)
+
+
+class _Index:
+    """Config property name index class.
+
+    Property names are indexed by depth, and by depth, position and name of
+    each of their parts, so that patterns can be matched by intersecting the
+    index entries of their literal parts.
+    """
+
+    __slots__ = ('_depths', '_parts')
+
+    def __init__(self):
+        self._depths = {}
+        self._parts = {}
+
+    def add(self, prop_name: str, value: Any):
+        """Add config property and any properties below it to index."""
+        for name in _prop_names(prop_name, value):
+            parts = name.split('.')
+            depth = len(parts)
+            self._depths.setdefault(depth, set()).add(name)
+            for position, part in enumerate(parts):
+                self._parts.setdefault((depth, position, part), set()).add(name)
+
+    def remove(self, prop_name: str, value: Any):
+        """Remove config property and any properties below it from index."""
+        for name in _prop_names(prop_name, value):
+            parts = name.split('.')
+            depth = len(parts)
+            keys = [(depth, position, part) for position, part in enumerate(parts)]
+            for entries, key in [(self._depths, depth)] + [(self._parts, key) for key in keys]:
+                names = entries.get(key)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del entries[key]
+
+    def match(self, parts: List[str]) -> List[str]:
+        """Match config property names against pattern parts."""
+        depth = len(parts)
+        keys = [(depth, position, part) for position, part in enumerate(parts) if not _is_wildcard(part)]
+        if keys:
+            entries = sorted((self._parts.get(key, ()) for key in keys), key=len)
+            names = set(entries[0]).intersection(*entries[1:])
+        else:
+            names = self._depths.get(depth, ())
+        if len(keys) < depth:
+            names = [name for name in names if self.matches(name.split('.'), parts)]
+        return sorted(names)
+
+    @staticmethod
+    def matches(name_parts: List[str], parts: List[str]) -> bool:
+        """Check config property name parts against pattern parts."""
+        from fnmatch import fnmatchcase
+
+        return len(name_parts) == len(parts) and all(
+            fnmatchcase(name_part, part) for name_part, part in zip(name_parts, parts))
+
+
+def _is_wildcard(part: str) -> bool:
+    """Check if config property name pattern part contains wildcards.
+
+    Args:
+        part: config property name pattern part
+
+    Returns:
+        True if *part* contains wildcards
+
+    """
+    return '*' in part or '?' in part or '[' in part
+
+
+def _prop_names(prop_name: str, value: Any, depth: int=None) -> Iterator[str]:
+    """Get names of config property and all properties below it.
+
+    Args:
+        prop_name: config property name
+        value: config value
+        depth: only get names of properties at this depth
+
+    Yields:
+        config property names
+
+    """
+    stack = [(prop_name, value)]
+    while stack:
+        name, value = stack.pop()
+        name_depth = name.count('.') + 1
+        if depth is None or name_depth == depth:
+            yield name
+        if isinstance(value, dict) and (depth is None or name_depth < depth):
+            stack.extend((f'{name}.{key}', child) for key, child in _dict_items(value))
+
+
+def _dump_json(outfile: IO[str], value: Any):
+    """Write config value to a file object as JSON.
+
+    Args:
+        outfile: file object to write to
+        value: config value
+
+    """
+    from json import JSONEncoder
+
+    encode = JSONEncoder(default=str).encode
+    if not isinstance(value, dict):
+        outfile.write(encode(value))
+        return
+    outfile.write('{')
+    stack = [iter(_dict_items(value))]
+    separator = ''
+    while stack:
+        for key, child in stack[-1]:
+            outfile.write(f'{separator}{encode(str(key))}: ')
+            if isinstance(child, dict):
+                outfile.write('{')
+                stack.append(iter(_dict_items(child)))
+                separator = ''
+                break
+            outfile.write(encode(child))
+            separator = ', '
+        else:
+            outfile.write('}')
+            stack.pop()
+            separator = ', '
+
+
+def _leaf_changes(prop_name: str, old_value: Any, new_value: Any) -> List[Tuple[str, Any, Any]]:
+    """Get changes of scalar config properties made by config change.
+
+    Args:
+        prop_name: config property name
+        old_value: config value before the change, None if it did not exist
+        new_value: config value after the change, None if it no longer exists
+
+    Returns:
+        config property names, old and new scalar values, of scalar config properties that changed
+
+    """
+    if not isinstance(old_value, dict) and not isinstance(new_value, dict):
+        return [(prop_name, old_value, new_value)]
+    old_values = {} if old_value is None else dict(_flatten(prop_name, old_value))
+    new_values = {} if new_value is None else dict(_flatten(prop_name, new_value))
+    changes = []
+    for name, value in old_values.items():
+        if name not in new_values:
+            changes.append((name, value, None))
+        elif new_values[name] != value:
+            changes.append((name, value, new_values[name]))
+    for name, value in new_values.items():
+        if name not in old_values:
+            changes.append((name, None, value))
+    return changes
+
+
+def _flatten(prop_name: str, value: Any) -> Iterator[Tuple[str, Any]]:
+    """Get names and values of scalar config properties in config value.
+
+    Args:
+        prop_name: config property name of *value*, or empty string for the root config object
+        value: config value
+
+    Yields:
+        config property names and scalar values, in depth-first order
+
+    """
+    if not isinstance(value, dict):
+        yield prop_name, value
+        return
+    prefix = f'{prop_name}.' if prop_name else ''
+    stack = [(prefix, iter(_dict_items(value)))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, child in items:
+            if isinstance(child, dict):
+                stack.append((f'{prefix}{key}.', iter(_dict_items(child))))
+                break
+            yield f'{prefix}{key}', child
+        else:
+            stack.pop()
+
+
+class _Watch:
+    """Config change watch asynchronous iterator class."""
+
+    __slots__ = ('_batches', '_records', '_finalizer', '__weakref__')
+
+    def __init__(self, config: Config, batches: 'Queue', listener: Callable[[List[ConfigChange]], None]):
+        self._batches = batches
+        self._records = iter(())
+        # The listener is removed when the iterator is closed or, if it is
+        # dropped without being closed or even started, garbage collected.
+        self._finalizer = finalize(self, config._unlisten, listener)
+
+    def __aiter__(self) -> '_Watch':
+        return self
+
+    async def __anext__(self) -> ConfigChange:
+        while self._finalizer.alive:
+            record = next(self._records, _MISSING)
+            if record is not _MISSING:
+                return record
+            self._records = iter(await self._batches.get())
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        if self._finalizer.alive:
+            self._finalizer()
+            # Wake up any coroutine waiting for changes, so that it stops.
+            self._batches.put_nowait(())
+
+
+class _Scope:
+    """Config override scope context manager class."""
+
+    __slots__ = ('_config', '_updates', '_check', '_token')
+
+    def __init__(self, config: Config, updates: List[Tuple[str, Any]], check: bool=True):
+        self._config = config
+        self._updates = updates
+        self._check = check
+        self._token = None
+
+    def __enter__(self) -> Config:
+        # The overrides in effect are kept in a config object based on the
+        # overridden one, copied from any enclosing scope and stored in a
+        # context variable so that they are local to the thread or task.
+        scopes = _SCOPES.get() or {}
+        outer = scopes.get(self._config)
+        scoped = Config(base=self._config)
+        if outer is not None:
+            scoped._overrides = dict(outer._overrides)
+            scoped._prefixes = dict(outer._prefixes)
+        for prop_name, prop_value in self._updates:
+            scoped._override(prop_name, prop_value, self._check)
+        self._token = _SCOPES.set({**scopes, self._config: scoped})
+        return scoped
+
+    def __exit__(self, *exc_info):
+        _SCOPES.reset(self._token)
+        self._token = None
+
+
+def _updates(args: tuple, kwargs: dict) -> List[Tuple[str, Any]]:
+    """Parse :meth:`configaro.put` arguments into config updates.
+
+    Args:
+        args: config property name and value, or one or more 'some.knob=value' update strings
+        kwargs: config property names and values keyword args
+
+    Returns:
+        config property names and values
+
+    Raises:
+        configaro.ConfigUpdateNotValidError: if config update string is not valid
+
+    """
+    # Handle passing in a prop name and an update value of any sort other than string.
+    if len(args) == 2 and isinstance(args[0], str) and not isinstance(args[1], str):
+        return [(args[0], args[1])]
+
+    # Handle positional string arguments.  If the caller wishes to modify
+    # nested properties, they must be passed in as update strings, such as
+    # 'log.level=INFO'.  Values will be cast from strings to their appropriate
+    # type.  Multiple updates can be specified in a single string separated by
+    # whitespace.
+    updates = []
+    if len(args) == 1 and isinstance(args[0], str):
+        args = args[0].split()
+    for arg in args:
+        try:
+            prop_name, value = arg.split('=')
+        except ValueError:
+            raise ConfigUpdateNotValidError(arg)
+        updates.append((prop_name, _cast(value)))
+
+    # Handle any keyword arguments.  If the caller doesn't care about nested
+    # property updates, property names and values may be passed in keyword args.
+    updates.extend(kwargs.items())
+    return updates
+
+
+def _update_arg(arg: str) -> str:
+    """Check command line argument holding a single config update string.
+
+    Args:
+        arg: command line argument
+
+    Returns:
+        config update string
+
+    Raises:
+        argparse.ArgumentTypeError: if argument is not a single valid config update string
+
+    """
+    from argparse import ArgumentTypeError
+
+    try:
+        updates = _updates((arg,), {})
+    except ConfigUpdateNotValidError:
+        updates = []
+    if len(updates) != 1:
+        raise ArgumentTypeError(f'config update not valid: {arg}')
+    return arg
+
+
+def _config_module_paths(config_package: str, locals_path: str=None, locals_env_var: str=None) -> List[str]:
+    """Config module paths accessor.
+
+    Returns:
+        config module paths
+
+    Raises:
+        configaro.ConfigModuleNotFoundError: if config module not found
+
+    """
+    config_paths = []
+    with _TRACER.span('package_dir', package=config_package):
+        package_dir = _config_package_dir(config_package)
+
+    # Start by adding the 'defaults' config module in the config package.
+    defaults_path = os.path.join(package_dir, f'{DEFAULTS_CONFIG_MODULE_NAME}.py')
+    if not os.path.exists(defaults_path):
+        raise ConfigModuleNotFoundError(defaults_path)
+    config_paths.append(defaults_path)
+
+    # Continue by adding the 'locals' config module from.
+    if not locals_path and locals_env_var:
+        locals_path = os.environ.get(locals_env_var)
+    if not locals_path:
+        locals_path = os.path.join(package_dir, f'{LOCALS_CONFIG_MODULE_NAME}.py')
+    if os.path.exists(locals_path):
+        config_paths.append(locals_path)
+    return config_paths
+
+
+def _config_fragment_paths(config_package: str) -> List[str]:
+    """Config fragment paths accessor.
+
+    Returns:
+        config fragment paths, in file name order
+
+    """
+    fragments_dir = os.path.join(_config_package_dir(config_package), FRAGMENTS_CONFIG_DIR_NAME)
+    if not os.path.isdir(fragments_dir):
+        return []
+    return [os.path.join(fragments_dir, name) for name in sorted(os.listdir(fragments_dir)) if name.endswith('.py')]
+
+
+def _config_package_dir(config_package: str) -> str:
+    """Config package directory accessor.
+
+    Returns:
+        config package directory
+
+    Raises:
+        ImportError: if config package cannot be found.
+
+    """
+    from importlib.util import find_spec
+
+    # Find the package without importing its config modules, which are
+    # loaded by path and kept out of sys.modules.
+    spec = find_spec(config_package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f'config package not found: {config_package}', name=config_package)
+    package_dirs = list(spec.submodule_search_locations)
+    for package_dir in package_dirs:
+        if os.path.exists(os.path.join(package_dir, f'{DEFAULTS_CONFIG_MODULE_NAME}.py')):
+            return package_dir
+    return package_dirs[0]
+
+
+def _cast(value: str) -> Union[None, bool, int, float, str]:
     """Cast string property value to real type.
 
     Args:
@@ -382,7 +3878,7 @@ def _cast(value: str) -> Union[None, bool, int, float, str]:
     return value
 
 
-def _get(data: Munch, prop_name: str, **kwargs: str) -> Union[Munch, Any]:
+def _get(data: dict, prop_name: str, **kwargs: str) -> Union[dict, Any]:
     """Get config value identified by config property in config data.
 
 
@@ -398,38 +3894,245 @@ def _get(data: Munch, prop_name: str, **kwargs: str) -> Union[Munch, Any]:
         configaro.ConfigPropertyNotFoundError: if property is not found and *default* keyword arg is not present
 
     """
-    try:
-        return eval(f'data.{prop_name}')  # NOTE: do not remove the 'data' parameter in function as it is used here!
-    except AttributeError:
+    # Use dict.get directly, bypassing slower lookup methods of dict subclasses.
+    value = data
+    for name in prop_name.split('.'):
+        value = _dict_get(value, name, _MISSING) if isinstance(value, dict) else _MISSING
+        if value is _MISSING:
+            return _missing(data, prop_name, kwargs)
+    return value
+
+
+def _resolve(value: Any) -> Any:
+    """Resolve config value, reading file values.
+
+    Args:
+        value: config value
+
+    Returns:
+        config value, or file contents if config value is a file value
+
+    """
+    return value.read() if value.__class__ is FileValue else value
+
+
+def _detach(value: Any) -> Any:
+    """Copy config value, copying dicts, lists and sets in it deeply.
+
+    Args:
+        value: config value
+
+    Returns:
+        copy of config value sharing no containers with it
+
+    """
+    if isinstance(value, dict):
+        return {name: _detach(child) for name, child in _dict_items(value)}
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _copy(value: Any) -> Any:
+    """Copy config value, copying sub config objects deeply.
+
+    Args:
+        value: config value
+
+    Returns:
+        copy of config value
+
+    """
+    if not isinstance(value, dict):
+        return value
+    return {name: _copy(child) if isinstance(child, dict) else child for name, child in _dict_items(value)}
+
+
+def _viewed(value: Any, cls: type=ConfigView, copies: Dict[int, ConfigView]=None) -> Any:
+    """Copy config value, copying sub config objects deeply into views.
+
+    Sub config objects found more than once in the config value are copied
+    once, and stay shared in the copy.
+
+    Args:
+        value: config value
+        cls: view class of the copy of *value*, if it is a sub config object
+        copies: copies of sub config objects made before, by id of sub config object, updated
+
+    Returns:
+        copy of config value
+
+    """
+    if not isinstance(value, dict):
+        return value
+    if copies is None:
+        copies = {}
+    view = copies.get(id(value))
+    if view is None:
+        view = copies[id(value)] = cls((name, _viewed(child, ConfigView, copies)) for name, child in _dict_items(value))
+    return view
+
+
+def _columnar(prop_name: str, value: Any, numpy: bool) -> Any:
+    """Convert list config value to columnar arrays.
+
+    Args:
+        prop_name: config property name
+        value: config value
+        numpy: return NumPy arrays
+
+    Returns:
+        array, or dict of arrays by column name
+
+    Raises:
+        configaro.ConfigPropertyNotColumnarError: if config value is not a list of numbers or of dicts with the same keys
+
+    """
+    if not isinstance(value, list) or not value:
+        raise ConfigPropertyNotColumnarError(prop_name)
+    if not isinstance(value[0], dict):
+        column = _column(value, numpy)
+        if isinstance(column, tuple):
+            raise ConfigPropertyNotColumnarError(prop_name)
+        return column
+    names = value[0].keys()
+    for record in value:
+        if not isinstance(record, dict) or record.keys() != names:
+            raise ConfigPropertyNotColumnarError(prop_name)
+    return {name: _column([record[name] for record in value], numpy) for name in names}
+
+
+def _column(values: list, numpy: bool) -> Any:
+    """Convert config values to a column.
+
+    Args:
+        values: config values
+        numpy: return NumPy array
+
+    Returns:
+        read-only NumPy array if *numpy* is true, else array of ints or floats, or tuple of other config values
+
+    """
+    if numpy:
+        import numpy as np
+
+        column = np.array(values)
+        column.flags.writeable = False
+        return column
+    types = set(map(type, values))
+    if types <= {int, float}:
+        from array import array
+
         try:
-            return kwargs['default']
-        except KeyError:
-            raise ConfigPropertyNotFoundError(data, prop_name)
+            return array('q' if types == {int} else 'd', values)
+        except OverflowError:
+            pass
+    return tuple(values)
 
 
-def _put(data: Munch, prop_name: str, prop_value=Any):
+def _compact(value: Any, scalars: dict) -> Any:
+    """Compact config value, interning keys and sharing equal scalar values.
+
+    Args:
+        value: config value
+        scalars: scalar config values found before, by type and value, updated
+
+    Returns:
+        compacted config value
+
+    """
+    if isinstance(value, dict):
+        from sys import intern
+
+        return ConfigView((intern(name) if type(name) is str else name, _compact(child, scalars))
+                          for name, child in _dict_items(value))
+    try:
+        return scalars.setdefault((type(value), value), value)
+    except TypeError:
+        return value
+
+
+def _missing(data: dict, prop_name: str, kwargs: dict) -> Any:
+    """Get default config value for a config property not found in config data.
+
+    Arg:
+        data: config data
+        prop_name: config property name
+        kwargs: keyword arguments
+
+    Returns:
+        *default* keyword arg
+
+    Raises:
+        configaro.ConfigPropertyNotFoundError: if *default* keyword arg is not present
+
+    """
+    if 'default' not in kwargs:
+        raise ConfigPropertyNotFoundError(data, prop_name)
+    return kwargs['default']
+
+
+def _put(data: dict, prop_name: str, prop_value: Any, undo: List[Tuple[dict, str, Any]]=None,
+         parents: Dict[str, dict]=None) -> Any:
     """Put config value identified by config property in config data.
 
     Arg:
         data: config data
         prop_name: config property name
         prop_value: config value
+        undo: sub config objects, names and values replaced by earlier puts of the same update, appended to
+        parents: parent sub config objects resolved by earlier puts of the same update, by property name, updated
+
+    Returns:
+        replaced config value
 
     Raises:
         configaro.ConfigPropertyNotFoundError: if config property is not found
         configaro.ConfigPropertyNotScalarError: if config property is not scalar and non-dict value is provided
 
     """
-    prop_parts = prop_name.split('.')
-    if len(prop_parts) > 1:
-        parent_prop_name = '.'.join(prop_parts[:-1])
-        prop_name = prop_parts[-1]
-        config = _get(data, parent_prop_name)
-    else:
-        config = data
-    if isinstance(config[prop_name], Munch) and not isinstance(prop_value, dict):
-        raise ConfigPropertyNotScalarError(config, prop_name)
-    config[prop_name] = prop_value
+    parent_prop_name, _, name = prop_name.rpartition('.')
+    config = None if parents is None else parents.get(parent_prop_name)
+    if config is None:
+        config = _get(data, parent_prop_name, default=None) if parent_prop_name else data
+        if not isinstance(config, dict):
+            raise ConfigPropertyNotFoundError(data, prop_name)
+        if parents is not None:
+            parents[parent_prop_name] = config
+    old_value = _dict_get(config, name, _MISSING)
+    if old_value is _MISSING:
+        raise ConfigPropertyNotFoundError(data, prop_name)
+    if isinstance(old_value, dict):
+        if not isinstance(prop_value, dict):
+            raise ConfigPropertyNotScalarError(config, name)
+        if parents:
+            # Parents below the replaced sub config object are no longer in the config data.
+            prefix = f'{prop_name}.'
+            for parent_prop_name in [key for key in parents if key == prop_name or key.startswith(prefix)]:
+                del parents[parent_prop_name]
+    _dict_setitem(config, name, prop_value)
+    if undo is not None:
+        undo.append((config, name, old_value))
+    return old_value
+
+
+def _assign(data: dict, prop_name: str, prop_value: Any, undo: List[Tuple[dict, str, Any]]=None):
+    """Assign config value identified by existing config property in config data.
+
+    Arg:
+        data: config data
+        prop_name: config property name
+        prop_value: config value
+        undo: sub config objects, names and values replaced by earlier assignments, appended to
+
+    """
+    parent_prop_name, _, name = prop_name.rpartition('.')
+    config = _get(data, parent_prop_name) if parent_prop_name else data
+    if undo is not None:
+        undo.append((config, name, _dict_get(config, name, _MISSING)))
+    _dict_setitem(config, name, prop_value)
 
 
 def _load(path: str) -> dict:
@@ -448,13 +4151,155 @@ def _load(path: str) -> dict:
     """
     module_dir = os.path.dirname(path)
     module_name = os.path.basename(path).replace('.py', '')
-    module = _import_module(module_dir, module_name)
-    try:
-        if not isinstance(module.config, dict):
+    with _TRACER.span('load', path=path) as span:
+        module = _import_module(module_dir, module_name)
+        try:
+            if not isinstance(module.config, dict):
+                raise ConfigModuleNotValidError(path)
+        except AttributeError:
             raise ConfigModuleNotValidError(path)
-        return module.config
-    except AttributeError:
-        raise ConfigModuleNotValidError(path)
+        if span:
+            span.set(values=sum(1 for _ in _flatten('', module.config)))
+        # Config modules are cached and shared by all loads, so hand out
+        # copies of their containers, which config values may be modified in.
+        return _detach(module.config)
+
+
+def _load_fragments(paths: List[str], workers: int=FRAGMENTS_LOAD_WORKERS) -> List[dict]:
+    """Load config values from config fragment files.
+
+    Config fragment files are read and compiled in a thread pool, and then
+    executed in order.  Unlike config modules, they are not added to
+    :data:`sys.modules`, so their file names need not be unique.
+
+    Args:
+        paths: config fragment file paths
+        workers: maximum number of threads reading and compiling files
+
+    Returns:
+        config data of each config fragment, in order of *paths*
+
+    Raises:
+        configaro.ConfigModuleNotValidError is fragment does not contain a 'config' dict attribute.
+
+    """
+    if len(paths) > 1 and workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            codes = list(executor.map(_compile, paths))
+    else:
+        codes = [_compile(path) for path in paths]
+
+    configs = []
+    for path, code in zip(paths, codes):
+        namespace = {'__name__': os.path.basename(path)[:-3], '__file__': path}
+        with _TRACER.span('exec', path=path) as span:
+            exec(code, namespace)
+            config = namespace.get('config')
+            if not isinstance(config, dict):
+                raise ConfigModuleNotValidError(path)
+            if span:
+                span.set(values=sum(1 for _ in _flatten('', config)))
+        configs.append(config)
+    return configs
+
+
+def _compile(path: str) -> CodeType:
+    """Read and compile config file.
+
+    Args:
+        path: config file path
+
+    Returns:
+        config file code
+
+    """
+    with _TRACER.span('read', path=path) as span:
+        with open(path, 'rb') as infile:
+            source = infile.read()
+        span.set(bytes=len(source))
+    with _TRACER.span('compile', path=path):
+        return compile(source, path, 'exec', dont_inherit=True)
+
+
+def _reduce(configs: List[dict]) -> dict:
+    """Merge a sequence of dictionaries, later ones taking precedence.
+
+    The dictionaries are merged pairwise in a balanced tree, so that each
+    value is copied a logarithmic rather than linear number of times.
+
+    Args:
+        configs: config data to merge
+
+    Returns:
+        merged config data
+
+    """
+    if not configs:
+        return {}
+    replaced = []
+    while len(configs) > 1:
+        merged = [_merge_replacing(original, deltas, replaced) for original, deltas in zip(configs[::2], configs[1::2])]
+        if len(configs) % 2:
+            merged.append(configs[-1])
+        configs = merged
+    data = dict(configs[0])
+    if replaced:
+        _unmark(data)
+    return data
+
+
+class _Replaced(dict):
+    """Merged sub config object that replaced a config value other than a sub config object.
+
+    Merging it into earlier config data must replace rather than merge, as
+    merging the config data in order would have.
+    """
+
+    __slots__ = ()
+
+
+def _merge_replacing(original: dict, deltas: dict, replaced: list) -> dict:
+    """Merge two dictionaries, keeping track of sub config objects replacing other values.
+
+    Unlike :meth:`_merge`, merging stays associative, so that merging in a
+    balanced tree gives the same result as merging in order.
+
+    Args:
+        original: original data
+        deltas: deltas data
+        replaced: sub config objects marked as replacing other values, appended to
+
+    Returns:
+        merged data
+
+    """
+    merged = _Replaced(original) if isinstance(original, _Replaced) else dict(original)
+    for name, value in _dict_items(deltas):
+        old_value = merged.get(name, _MISSING)
+        if isinstance(value, _Replaced) or not isinstance(value, dict) or old_value is _MISSING:
+            merged[name] = value
+        elif isinstance(old_value, dict):
+            merged[name] = _merge_replacing(old_value, value, replaced)
+        else:
+            merged[name] = _Replaced(value)
+            replaced.append(name)
+    return merged
+
+
+def _unmark(data: dict):
+    """Turn sub config objects marked by :meth:`_merge_replacing` back into dicts, in place.
+
+    Args:
+        data: merged config data
+
+    """
+    for name, value in data.items():
+        if isinstance(value, dict):
+            if isinstance(value, _Replaced):
+                value = data[name] = dict(value)
+            _unmark(value)
 
 
 def _merge(original: dict, deltas: dict) -> Tuple[str, Any]:
@@ -483,9 +4328,80 @@ def _merge(original: dict, deltas: dict) -> Tuple[str, Any]:
             yield k, deltas[k]
 
 
+def _accessor(data: dict, prop_name: str) -> '_Accessor':
+    """Build a typed accessor object from config data.
+
+    Args:
+        data: config data
+        prop_name: config property name of *data*
+
+    Returns:
+        typed accessor object
+
+    """
+    data = {field: _resolve(value) for field, value in data.items()}
+    cls = accessor_class(data, _accessor_name(prop_name))
+    obj = cls.__new__(cls)
+    for field, value in data.items():
+        if isinstance(value, dict):
+            value = _accessor(value, field)
+        setattr(obj, field, value)
+    return obj
+
+
+def _accessor_name(prop_name: str) -> str:
+    """Get accessor class name for a config property.
+
+    Args:
+        prop_name: config property name
+
+    Returns:
+         accessor class name
+
+    """
+    name = prop_name.rpartition('.')[2]
+    return ''.join(part.capitalize() for part in name.split('_')) or 'Config'
+
+
+class _Accessor:
+    """Typed accessor base class."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Accessor):
+            return type(self) is type(other) and self._asdict() == other._asdict()
+        return isinstance(other, dict) and self._asdict() == other
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def _asdict(self) -> dict:
+        return {field: _asdict(getattr(self, field)) for field in self.__slots__}
+
+
+def _asdict(value: Any) -> Any:
+    """Convert typed accessor object to config data.
+
+    Args:
+        value: typed accessor object or config value
+
+    Returns:
+        config data or config value
+
+    """
+    return value._asdict() if isinstance(value, _Accessor) else value
+
+
 def _import_module(module_dir: str, module_name: str) -> ModuleType:
     """Import module from directory.
 
+    Config modules are not added to :data:`sys.modules`, so that equally named
+    config modules of different config packages do not collide.  They are
+    cached by resolved path instead, and executed again only when their
+    contents change.
+
     Args:
         module_dir: module directory path
         module_name: name of module to import from *module_dir*
@@ -497,10 +4413,30 @@ def _import_module(module_dir: str, module_name: str) -> ModuleType:
         ImportError: if module cannot be imported
 
     """
-    filename = _module_path(module_dir, module_name)
-    if module_name in sys.modules:
-        return sys.modules[module_name]
-    return _ConfigLoader(module_name, filename).load_module(module_name)
+    from hashlib import blake2b
+
+    path = os.path.realpath(_module_path(module_dir, module_name))
+    try:
+        stat = os.stat(path)
+    except OSError as error:
+        raise ImportError(f'config module not found: {path}', name=module_name, path=path) from error
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _MODULES.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[2]
+
+    # Files touched without changing their contents need not be executed again.
+    loader = _ConfigLoader(module_name, path)
+    fingerprint = blake2b(loader.read(), digest_size=16).digest()
+    if cached is not None and cached[1] == fingerprint:
+        module = cached[2]
+    else:
+        from importlib.util import module_from_spec, spec_from_file_location
+
+        module = module_from_spec(spec_from_file_location(module_name, path, loader=loader))
+        loader.exec_module(module)
+    _MODULES[path] = (stamp, fingerprint, module)
+    return module
 
 
 def _module_path(module_dir: str, module_name: str) -> str:
@@ -518,14 +4454,28 @@ def _module_path(module_dir: str, module_name: str) -> str:
     return os.path.join(filename, '__init__.py') if os.path.isdir(filename) else f'{filename}.py'
 
 
-class _ConfigLoader(FileLoader, SourceLoader):
-    """Config module loader class."""
+class _ConfigLoader(SourceFileLoader):
+    """Config module loader class, compiling the source last read by :meth:`read`."""
+
+    source = None
+
+    def read(self) -> bytes:
+        with _TRACER.span('read', path=self.path) as span:
+            try:
+                self.source = self.get_data(self.path)
+            except OSError as error:
+                raise ImportError(f'config module not readable: {self.path}', name=self.name) from error
+            span.set(bytes=len(self.source))
+        return self.source
 
     def get_code(self, fullname: str) -> CodeType:
-        source = self.get_source(fullname)
-        path = self.get_filename(fullname)
-        parsed = ast.parse(source)
-        return compile(parsed, path, 'exec', dont_inherit=True)
+        source = self.read() if self.source is None else self.source
+        with _TRACER.span('compile', path=self.path):
+            return compile(source, self.path, 'exec', dont_inherit=True)
+
+    def exec_module(self, module: ModuleType):
+        with _TRACER.span('exec', path=module.__file__):
+            super().exec_module(module)
 
     def module_repr(self, module: ModuleType):
         return f'<config module {module.__name__} at {module.__file__}>'
@@ -0,0 +1,7 @@
+__all__ = ['config']
+
+config = {
+    'log': {
+        'level': 'INFO'
+    }
+}
@@ -0,0 +1,12 @@
+__all__ = ['config']
+
+config = {
+    'log': {
+        'level': 'WARNING'
+    },
+    'monitoring': {
+        'haproxy': {
+            'disabled': True
+        }
+    }
+}
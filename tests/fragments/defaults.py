@@ -0,0 +1,17 @@
+__all__ = ['config']
+
+config = {
+    'name': 'fragments',
+    'log': {
+        'file': 'fragments.txt',
+        'level': 'ERROR'
+    },
+    'monitoring': {
+        'haproxy': {
+            'disabled': False
+        },
+        'nginx': {
+            'disabled': False
+        }
+    }
+}
@@ -1,9 +1,14 @@
 import os
+import subprocess
+import sys
 
 import munch
 import pytest
 
+IMPORT_TIME_BUDGET_US = 40000
+
 CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'config'))
+FRAGMENTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fragments', 'conf.d'))
 
 SAMPLE_DATA = {
     'name': 'defaults',
@@ -22,12 +27,37 @@ SAMPLE_DATA = {
 }
 
 
+def test_import_time():
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    command = [sys.executable, '-X', 'importtime', '-c', 'import configaro, sys; print(sorted(sys.modules))']
+    root_dir = os.path.dirname(os.path.dirname(CONFIG_DIR))
+    timings = []
+    for _ in range(3):
+        result = subprocess.run(command, cwd=root_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True, check=True)
+        for line in result.stderr.splitlines():
+            if line.rstrip().endswith('| configaro'):
+                timings.append(int(line.split('|')[1]))
+    for module in ['ast', 'importlib.abc', 'json', 'munch']:
+        assert f"'{module}'" not in result.stdout
+    assert min(timings) < IMPORT_TIME_BUDGET_US
+
+
+def test_type_hints():
+    import typing
+    import configaro
+    assert typing.get_type_hints(configaro.get) == {'prop_names': str, 'kwargs': str, 'return': typing.Any}
+    assert typing.get_type_hints(configaro.Config.put)['args'] is str
+
+
 def test__module_path():
     from configaro import _module_path
     assert _module_path(CONFIG_DIR, 'defaults') == os.path.join(CONFIG_DIR, 'defaults.py')
 
 
-def test__import_module():
+def test__import_module(tmp_path):
+    import sys
     from configaro import _import_module
     module = _import_module(CONFIG_DIR, 'defaults')
     assert module.config == SAMPLE_DATA
@@ -35,6 +65,23 @@ def test__import_module():
     with pytest.raises(ImportError):
         _import_module(CONFIG_DIR, 'default')
 
+    for package in ('first', 'second'):
+        (tmp_path / package).mkdir()
+        (tmp_path / package / 'defaults.py').write_text(f'config = {{"name": "{package}"}}\n')
+    first = _import_module(str(tmp_path / 'first'), 'defaults')
+    second = _import_module(str(tmp_path / 'second'), 'defaults')
+    assert (first.config['name'], second.config['name']) == ('first', 'second')
+    assert sys.modules.get('defaults') not in (first, second)
+    assert _import_module(str(tmp_path / 'first'), 'defaults') is first
+
+    path = tmp_path / 'first' / 'defaults.py'
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert _import_module(str(tmp_path / 'first'), 'defaults') is first
+    path.write_text('config = {"name": "changed"}\n')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+    assert _import_module(str(tmp_path / 'first'), 'defaults').config['name'] == 'changed'
+
 
 def test__merge():
     from configaro import _merge
@@ -69,12 +116,52 @@ def test__merge():
     assert merged == expected
 
 
-def test__load():
+def test__reduce():
+    from configaro import _merge, _reduce
+    configs = [{'a': {'b': i, f'c{i}': i}} for i in range(7)]
+    expected = {}
+    for config in configs:
+        expected = dict(_merge(expected, config))
+    assert _reduce(configs) == expected
+    assert _reduce(configs)['a']['b'] == 6
+    assert _reduce([]) == {}
+
+    configs = [{'db': {'host': 'h', 'port': 1}}, {}, {'db': None}, {'db': {'port': 2}}, {'db': {'user': 'u'}}]
+    for count in range(1, len(configs) + 1):
+        expected = {}
+        for config in configs[:count]:
+            expected = dict(_merge(expected, config))
+        reduced = _reduce(configs[:count])
+        assert reduced == expected
+        assert all(type(value) is dict for value in reduced.values() if isinstance(value, dict))
+    assert reduced == {'db': {'port': 2, 'user': 'u'}}
+
+
+def test__load_fragments():
+    from configaro import ConfigModuleNotValidError, _config_fragment_paths, _load_fragments
+    paths = _config_fragment_paths('tests.fragments')
+    assert paths == [os.path.join(FRAGMENTS_DIR, '10-log.py'), os.path.join(FRAGMENTS_DIR, '20-log.py')]
+    assert _config_fragment_paths('tests.config') == []
+    configs = _load_fragments(paths)
+    assert configs == _load_fragments(paths, workers=1)
+    assert [config['log']['level'] for config in configs] == ['INFO', 'WARNING']
+    with pytest.raises(ConfigModuleNotValidError):
+        _load_fragments([os.path.join(os.path.dirname(FRAGMENTS_DIR), '__init__.py')])
+
+
+def test__load(tmp_path):
     from configaro import _load, _module_path
     path = _module_path(CONFIG_DIR, 'defaults')
     config = _load(path)
     assert config['name'] == 'defaults'
 
+    path = tmp_path / 'defaults.py'
+    path.write_text('config = {"hosts": ["a"], "log": {"level": "INFO"}}\n')
+    config = _load(str(path))
+    config['hosts'].append('evil')
+    config['log']['level'] = 'DEBUG'
+    assert _load(str(path)) == {'hosts': ['a'], 'log': {'level': 'INFO'}}
+
 
 def test__cast():
     from configaro import _cast
@@ -105,10 +192,43 @@ def test__put():
     _put(data, 'log.level', 'DEBUG')
     assert _get(data, 'log.level') == 'DEBUG'
 
+    from configaro import ConfigPropertyNotFoundError, ConfigPropertyNotScalarError
+    data = {'log': {'level': 'ERROR', 'file': 'a.log'}, 'name': 'defaults'}
+    log = data['log']
+    undo, parents = [], {}
+    assert _put(data, 'log.level', 'DEBUG', undo, parents) == 'ERROR'
+    assert _put(data, 'log.file', 'b.log', undo, parents) == 'a.log'
+    assert list(parents) == ['log'] and parents['log'] is log
+    assert data['log'] is log and log == {'level': 'DEBUG', 'file': 'b.log'}
+    assert undo == [(log, 'level', 'ERROR'), (log, 'file', 'a.log')]
+    _put(data, 'log', {'level': 'INFO'}, undo, parents)
+    assert 'log' not in parents
+    for prop_name in ('log.missing', 'missing.level', 'name.level'):
+        with pytest.raises(ConfigPropertyNotFoundError):
+            _put(data, prop_name, 'x')
+    with pytest.raises(ConfigPropertyNotScalarError):
+        _put(data, 'log', 'x')
+
 
-def test__config_package_dir():
-    from configaro import _config_package_dir
+def test__config_package_dir(tmp_path, monkeypatch):
+    import sys
+    from configaro import Config, _config_package_dir
     assert _config_package_dir('tests.config') == CONFIG_DIR
+    with pytest.raises(ImportError):
+        _config_package_dir('tests.missing')
+
+    package_dir = tmp_path / 'counted_config'
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('')
+    runs = tmp_path / 'runs.txt'
+    (package_dir / 'defaults.py').write_text(f'open({str(runs)!r}, "a").write("x")\nconfig = {{"name": "counted"}}\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert _config_package_dir('counted_config') == str(package_dir)
+    config = Config()
+    config.init('counted_config')
+    assert config.get('name') == 'counted'
+    assert runs.read_text() == 'x'
+    assert 'counted_config.defaults' not in sys.modules
 
 
 def test___config_module_paths():
@@ -124,16 +244,51 @@ def test___config_module_paths():
 def test_exports():
     from configaro import __all__ as exports
     expected = [
+        'Config',
+        'ConfigChange',
+        'ConfigClient',
+        'ConfigFootprint',
         'ConfigError',
         'ConfigModuleNotFoundError',
         'ConfigModuleNotValidError',
         'ConfigObjectNotInitializedError',
+        'ConfigPropertyNotColumnarError',
         'ConfigPropertyNotFoundError',
         'ConfigPropertyNotScalarError',
+        'ConfigReferenceNotValidError',
+        'ConfigServer',
+        'ConfigStore',
         'ConfigUpdateNotValidError',
+        'ConfigVersionNotAvailableError',
+        'ConfigView',
+        'FileValue',
+        'TraceRecorder',
+        'Tracer',
+        'accessor_class',
+        'add_put_argument',
+        'adopt_blob',
+        'changes',
+        'compile_store',
+        'dump',
+        'export_blob',
+        'footprint',
+        'freeze',
         'get',
+        'get_columns',
+        'get_matching',
+        'get_prefixed',
+        'get_typed',
         'init',
+        'init_async',
+        'override',
         'put',
+        'put_arguments',
+        'reload',
+        'reload_async',
+        'serve',
+        'set_tracer',
+        'version',
+        'watch',
     ]
     assert sorted(exports) == sorted(expected)
 
@@ -177,6 +332,138 @@ def test_get():
     assert get('monitoring.nginx.disable', default=None) is None
 
 
+def test_get_matching():
+    from configaro import Config, get_matching, init, override
+    init('tests.config')
+    disabled = get_matching('monitoring.*.disabled')
+    assert not isinstance(disabled, (list, tuple))
+    assert list(disabled) == [('monitoring.haproxy.disabled', True), ('monitoring.nginx.disabled', True)]
+    assert [name for name, _ in get_matching('*.h?proxy')] == ['monitoring.haproxy']
+    assert [name for name, _ in get_matching('*')] == ['log', 'monitoring', 'name']
+    assert list(get_matching('monitoring.*.missing')) == []
+    with override('monitoring.haproxy.disabled=False'):
+        assert dict(get_matching('monitoring.*.disabled')) == {
+            'monitoring.haproxy.disabled': False, 'monitoring.nginx.disabled': True}
+
+    config = Config()
+    config.init('tests.config')
+    assert len(list(config.get_matching('monitoring.*.disabled'))) == 2
+    config.put('monitoring', munch.munchify({'haproxy': {'disabled': False}, 'varnish': {'disabled': True}}))
+    assert list(config.get_matching('monitoring.*.disabled')) == [
+        ('monitoring.haproxy.disabled', False), ('monitoring.varnish.disabled', True)]
+    config.put('monitoring.varnish.disabled=False')
+    assert list(config.get_matching('*.varnish.disabled')) == [('monitoring.varnish.disabled', False)]
+    config.put({'monitoring': False})
+    assert [name for name, _ in config.get_matching('monitoring*')] == ['monitoring']
+    assert list(config.get_matching('monitoring.*')) == []
+
+
+def test_get_prefixed():
+    from configaro import get_prefixed, init
+    init('tests.config')
+    assert dict(get_prefixed('log')) == {'log.file': 'some-file.txt', 'log.level': 'DEBUG'}
+    assert dict(get_prefixed('log.level')) == {'log.level': 'DEBUG'}
+    assert len(dict(get_prefixed())) == 5
+
+
+def test_get_misses():
+    from configaro import MISSES_CACHE_SIZE, Config
+    config = Config()
+    config.init('tests.config')
+    assert config.get('flags.new_ui', default=False) is False
+    assert 'flags.new_ui' in config._misses
+    config.put({'flags': munch.munchify({'new_ui': True})})
+    assert not config._misses
+    assert config.get('flags.new_ui', default=False) is True
+    for i in range(MISSES_CACHE_SIZE + 10):
+        config.get(f'flags.flag_{i}', default=None)
+        assert len(config._misses) <= MISSES_CACHE_SIZE
+    assert len(config._misses) == 10
+
+
+def test_dump():
+    import io
+    import json
+    from configaro import Config, dump, get, init
+    init('tests.config')
+    outfile = io.StringIO()
+    dump(outfile)
+    lines = outfile.getvalue().splitlines()
+    assert 'log.level=DEBUG' in lines
+    assert 'monitoring.haproxy.disabled=True' in lines
+    assert len(lines) == 5
+    config = Config()
+    config.init('tests.fragments')
+    config.put(*lines)
+    assert config.get() == get()
+
+    outfile = io.StringIO()
+    dump(outfile, as_json=True)
+    assert json.loads(outfile.getvalue()) == munch.unmunchify(get())
+    outfile = io.StringIO()
+    dump(outfile, prefix='monitoring.nginx', as_json=True)
+    assert json.loads(outfile.getvalue()) == {'disabled': True}
+    outfile = io.StringIO()
+    dump(outfile, prefix='log.level', as_json=True)
+    assert json.loads(outfile.getvalue()) == 'DEBUG'
+
+
+def test_get_typed():
+    from configaro import get, get_typed, init, put
+    init('tests.config')
+    config = get_typed()
+    assert config.log.level == get('log.level')
+    assert config.monitoring.haproxy.disabled is True
+    assert get_typed('log') == config.log
+    assert get_typed('log') is get_typed('log')
+    assert get_typed('log.level') == get('log.level')
+    assert get_typed('monitoring.nginx.disable', default=None) is None
+    log = get_typed('log')
+    put('log.file=other-file.txt')
+    assert get_typed('log').file == 'other-file.txt'
+    assert log.file == 'some-file.txt'
+    put('log.file=some-file.txt')
+
+
+def test_get_typed_threads():
+    import threading
+    from configaro import Config
+    config = Config()
+    config.init('tests.config')
+    errors = []
+
+    def read():
+        try:
+            for _ in range(2000):
+                config.get_typed('log')
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(200):
+        config.put(f'log.file=file-{i}.txt')
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert config.get_typed('log').file == 'file-199.txt'
+
+
+def test_accessor_class():
+    from configaro import ConfigError, accessor_class
+    cls = accessor_class({'file': str, 'level': str}, name='Log')
+    assert cls.__slots__ == ('file', 'level')
+    assert cls.__annotations__ == {'file': str, 'level': str}
+    assert accessor_class({'file': 'a.txt', 'level': 'INFO'}, name='Log') is cls
+    nested = accessor_class(SAMPLE_DATA)
+    assert nested.__annotations__['log'] is cls
+    with pytest.raises(AttributeError):
+        cls().extra = True
+    with pytest.raises(ConfigError):
+        accessor_class({'not-valid': True})
+
+
 def test_put():
     from configaro import ConfigPropertyNotScalarError, ConfigUpdateNotValidError, get, init, put
     init('tests.config')
@@ -191,6 +478,474 @@ def test_put():
         put('log=INFO')
 
 
+def test_override():
+    import threading
+    from configaro import ConfigPropertyNotScalarError, get, init, override
+    init('tests.config')
+    level = get('log.level')
+    with override('log.level=TRACE') as scoped:
+        assert get('log.level') == 'TRACE'
+        assert get('log').level == 'TRACE'
+        assert scoped.get('log.level') == 'TRACE'
+        with override(log={'level': 'INNER'}):
+            assert get('log') == {'level': 'INNER'}
+        assert get('log.file') == 'some-file.txt'
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get('log.level')))
+        thread.start()
+        thread.join()
+        assert seen == [level]
+    assert get('log.level') == level
+    with pytest.raises(ConfigPropertyNotScalarError):
+        with override('log=INFO'):
+            pass
+
+
+def test_Config():
+    from configaro import Config, ConfigObjectNotInitializedError, ConfigPropertyNotScalarError
+    base = Config()
+    tenant = Config(base=base)
+    with pytest.raises(ConfigObjectNotInitializedError):
+        tenant.get()
+    tenant.init('tests.config')
+    assert base.initialized and tenant.initialized
+    assert tenant.get('log') is base.get('log')
+
+    tenant.put('log.level=INFO monitoring.nginx.disabled=False')
+    assert tenant.get('log.level') == 'INFO'
+    assert tenant.get('log').level == 'INFO'
+    assert tenant.get('log').file == 'some-file.txt'
+    assert tenant.get().monitoring.nginx.disabled is False
+    assert tenant.get('monitoring.haproxy') is base.get('monitoring.haproxy')
+    assert tenant.get().log.level == 'INFO'
+    assert base.get('log.level') == 'DEBUG'
+    assert base.get('monitoring.nginx.disabled') is True
+    with pytest.raises(ConfigPropertyNotScalarError):
+        tenant.put('log=INFO')
+
+    tenant.put('monitoring', {'haproxy': {'disabled': False}})
+    assert tenant.get('monitoring.haproxy.disabled') is False
+    assert tenant.get('monitoring.nginx', default=None) is None
+    tenant.put('monitoring.haproxy.disabled=True')
+    assert tenant.get('monitoring') == {'haproxy': {'disabled': True}}
+    assert tenant.get_typed('log').level == 'INFO'
+    assert sorted(tenant._overrides) == ['log.level', 'monitoring']
+
+
+def test_Config_fragments():
+    from configaro import Config
+    config = Config()
+    config.init('tests.fragments')
+    assert config.get('name') == 'fragments'
+    assert config.get('log.file') == 'fragments.txt'
+    assert config.get('log.level') == 'WARNING'
+    assert config.get('monitoring.haproxy.disabled') is True
+    assert config.get('monitoring.nginx.disabled') is False
+
+
+def test_Config_changes():
+    import configaro
+    from configaro import Config, ConfigVersionNotAvailableError
+    config = Config()
+    config.init('tests.config')
+    assert config.version == 0
+    assert config.changes(0) == []
+    config.put('log.level=INFO name=changed')
+    config.put('log.file=other.txt')
+    assert config.version == 2
+    records = config.changes(0)
+    assert [(r.version, r.prop_name, r.old_value, r.new_value) for r in records] == [
+        (1, 'log.level', 'DEBUG', 'INFO'),
+        (1, 'name', 'locals', 'changed'),
+        (2, 'log.file', 'some-file.txt', 'other.txt'),
+    ]
+    assert [r.prop_name for r in config.changes(1)] == ['log.file']
+    assert config.changes(2) == []
+
+    config.reload()
+    assert config.version == 3
+    assert config.get('log.level') == 'DEBUG'
+    assert sorted((r.prop_name, r.new_value) for r in config.changes(2)) == [
+        ('log.file', 'some-file.txt'), ('log.level', 'DEBUG'), ('name', 'locals')]
+
+    # Sub config objects are journaled as changes of their scalar properties.
+    config.put('log', {'level': 'DEBUG', 'file': 'other.txt', 'rotate': {'days': 7}})
+    assert [(r.prop_name, r.old_value, r.new_value) for r in config.changes(3)] == [
+        ('log.file', 'some-file.txt', 'other.txt'), ('log.rotate.days', None, 7)]
+    config.put({'log': 'off'})
+    assert [(r.prop_name, r.old_value, r.new_value) for r in config.changes(4)] == [
+        ('log.level', 'DEBUG', None), ('log.file', 'other.txt', None), ('log.rotate.days', 7, None),
+        ('log', None, 'off')]
+
+    for i in range(configaro.JOURNAL_SIZE):
+        config.put(f'name=name{i}')
+    with pytest.raises(ConfigVersionNotAvailableError):
+        config.changes(2)
+    assert len(config.changes(5)) == configaro.JOURNAL_SIZE
+    assert configaro.version() == configaro._CONFIG.version
+
+
+def test_ConfigStore(tmp_path):
+    from configaro import (Config, ConfigModuleNotValidError, ConfigPropertyNotFoundError, ConfigStore,
+                           compile_store)
+    path = str(tmp_path / 'routes.cfgs')
+    compile_store(path, {'routes': {'a': {'port': 80}, 'b': {'port': 443, 'tls': True}}, 'routesx': 1})
+    store = ConfigStore(path)
+    assert len(store) == 4
+    assert store.get('routes.b.port') == 443
+    assert store.get('routes.b') == {'port': 443, 'tls': True}
+    assert store.get('routes') == {'a': {'port': 80}, 'b': {'port': 443, 'tls': True}}
+    assert store.get('routes.c', 'missing') == 'missing'
+    assert 'routesx' in store and 'routes.a.tls' not in store
+    store.close()
+    config = Config()
+    config.init('tests.config', store_path=path)
+    assert config.get('routes.a.port') == 80
+    assert config.get('routes.b').tls is True
+    assert config.get('log.level') == 'DEBUG'
+    with pytest.raises(ConfigPropertyNotFoundError):
+        config.put('routes.a.port=8080')
+    with config.override('routes.a.port=8080'):
+        assert config.get('routes.a') == {'port': 8080}
+    mapping = config._store._mmap
+    config.reload()
+    assert config.get('routes.a.port') == 80
+    assert mapping.closed and not config._store._mmap.closed
+    with open(path, 'wb') as outfile:
+        outfile.write(b'not a store')
+    with pytest.raises(ConfigModuleNotValidError):
+        ConfigStore(path)
+
+
+def test_FileValue(tmp_path, monkeypatch):
+    import configaro
+    from configaro import Config, FileValue
+    cert_path, key_path = tmp_path / 'cert.pem', tmp_path / 'key.der'
+    cert_path.write_text('CERT-1')
+    key_path.write_bytes(b'\x00KEY')
+    config = Config()
+    config.init('tests.config')
+    config.put({'tls': {'cert': FileValue(str(cert_path)), 'key': FileValue(str(key_path), binary=True)}})
+    assert config.get('tls.cert') == 'CERT-1'
+    assert config.get('tls.key') == b'\x00KEY'
+    assert config.get('tls')['cert'] == config.get('tls').cert == config.get().tls.cert == 'CERT-1'
+    assert config.get_typed('tls').cert == 'CERT-1'
+    assert dict(config.get('tls').items()) == {'cert': 'CERT-1', 'key': b'\x00KEY'}
+    assert isinstance(config.get('tls')._asdict()['cert'], FileValue)
+    cert_path.write_text('CERT-22')
+    assert config.get('tls.cert') == 'CERT-22'
+    assert config.get('tls').cert == 'CERT-22'
+    monkeypatch.setattr(configaro, 'FILE_VALUES_CACHE_SIZE', 10)
+    configaro._FILE_VALUES.clear()
+    config.get('tls.cert', 'tls.key')
+    assert list(configaro._FILE_VALUES._entries) == [(str(key_path), True, 'utf-8')]
+    assert configaro._FILE_VALUES._used == 4
+
+
+def test__Interpolation():
+    from configaro import ConfigPropertyNotFoundError, ConfigReferenceNotValidError, _Interpolation, _flatten
+    data = munch.munchify({
+        'log': {'dir': '/var/log', 'file': '${log.path}', 'path': '${log.dir}/app.log', 'level': 10},
+        'server': {'port': '${ports.http}', 'label': 'port $${x} ${ports.http}', 'ports': '${ports}'},
+        'ports': {'http': 80},
+    })
+    interpolation = _Interpolation()
+    for prop_name, value in _flatten('', data):
+        interpolation.add(prop_name, value)
+    interpolation.resolve(data, list(interpolation.templates))
+    assert data['log']['file'] == data['log']['path'] == '/var/log/app.log'
+    assert data['server'] == {'port': 80, 'label': 'port ${x} 80', 'ports': {'http': 80}}
+    assert data['server']['ports'] is not data['ports']
+    assert interpolation.dependents(['log.dir'], set()) == {'log.path', 'log.file'}
+    assert interpolation.dependents(['ports'], {'ports'}) == {'server.port', 'server.label', 'server.ports'}
+    interpolation.add('a', '${b}')
+    interpolation.add('b', '${c.d}')
+    interpolation.add('c.d', '${a}')
+    with pytest.raises(ConfigReferenceNotValidError) as excinfo:
+        interpolation.resolve(data, ['a', 'b', 'c.d'])
+    assert excinfo.value.prop_names == ['a', 'b', 'c.d', 'a']
+    interpolation.add('x', '${missing}')
+    with pytest.raises(ConfigPropertyNotFoundError):
+        interpolation.resolve(data, ['x'])
+
+
+def test_put_interpolation():
+    from configaro import Config, ConfigPropertyNotFoundError, ConfigReferenceNotValidError
+    config = Config()
+    config.init('tests.config')
+    config.put({'paths': {'root': '/srv', 'logs': '${paths.root}/logs'}})
+    config.put('log.file=${paths.logs}/app.log')
+    assert config.get('log.file') == '/srv/logs/app.log'
+    version = config.version
+    config.put('paths.root=/opt')
+    assert config.get('paths.logs', 'log.file') == ('/opt/logs', '/opt/logs/app.log')
+    assert [(c.prop_name, c.new_value) for c in config.changes(version)] == [
+        ('paths.root', '/opt'), ('paths.logs', '/opt/logs'), ('log.file', '/opt/logs/app.log')]
+    config.put('log.file=plain.log')
+    config.put('paths.root=/tmp')
+    assert config.get('log.file') == 'plain.log'
+    version = config.version
+    with pytest.raises(ConfigReferenceNotValidError):
+        config.put('paths.root=${paths.logs}')
+    with pytest.raises(ConfigPropertyNotFoundError):
+        config.put('paths.root=${nope}')
+    assert config.get('paths.root', 'paths.logs') == ('/tmp', '/tmp/logs')
+    assert config.version == version
+    config.put('paths.root=/srv')
+    assert config.get('paths.logs') == '/srv/logs'
+
+    tenant = Config(base=config)
+    tenant.put('paths.root=/opt')
+    assert tenant.get('paths.logs') == '/opt/logs'
+    assert tenant.get().paths.logs == '/opt/logs'
+    assert config.get('paths.logs') == '/srv/logs'
+    tenant.put('paths.root=/var')
+    assert tenant.get('paths.logs') == '/var/logs'
+    tenant.put('paths.logs=/own')
+    tenant.put('paths.root=/usr')
+    assert tenant.get('paths.logs') == '/own'
+    assert tenant.changes(tenant.version - 1)[0].prop_name == 'paths.root'
+
+
+def test_ConfigView():
+    import copy
+    import json
+    import pickle
+    from configaro import Config, ConfigView, _config_module_paths, _load
+    config = Config()
+    config.init('tests.config')
+    log = config.get('log')
+    assert isinstance(log, ConfigView) and isinstance(log, dict)
+    assert log is config.get('log') is config.get().log
+    assert log.level == log['level'] == log.get('level') == 'DEBUG'
+    assert dict(log) == {'file': 'some-file.txt', 'level': 'DEBUG'}
+    assert sorted(log.items()) == [('file', 'some-file.txt'), ('level', 'DEBUG')]
+    assert 'level' in log and len(log) == 2 and log.get('missing') is None
+    assert json.loads(json.dumps(config.get())) == config.get()
+    with pytest.raises(AttributeError):
+        log.missing
+    with pytest.raises(AttributeError):
+        log.level = 'INFO'
+    for modify in (lambda: log.__setitem__('level', 'INFO'), lambda: log.update(level='INFO'), log.clear):
+        with pytest.raises(TypeError):
+            modify()
+
+    # Views of sub config objects and of the root config object see puts alike.
+    root = config.get()
+    config.put('log.level=INFO')
+    assert log.level == root.log.level == config.get('log').level == 'INFO'
+    assert config.get('log') is log
+    assert _load(_config_module_paths('tests.config')[1])['log']['level'] == 'DEBUG'
+    config.put({'flags': {'ui': {'dark': True}}})
+    assert config.get('flags').ui.dark is True
+    assert config.get('flags').ui is config.get('flags').ui
+    config.put({'copy': config.get('flags.ui')})
+    assert config.get('copy') == {'dark': True}
+    assert config.get('copy') is not config.get('flags.ui')
+    assert copy.deepcopy(root) == pickle.loads(pickle.dumps(root)) == root
+
+
+def test_override_log(tmp_path, monkeypatch):
+    import threading
+    import configaro
+    from configaro import Config
+    log_path = str(tmp_path / 'overrides.log')
+    config = Config()
+    config.init('tests.config', log_path=log_path)
+    config.put('log.level=INFO')
+    config.put({'flags': {'new_ui': True}})
+    config.put('flags.new_ui=False', name='logged')
+    config._log.sync()
+    with open(log_path) as infile:
+        assert len(infile.readlines()) == 3
+
+    restarted = Config()
+    restarted.init('tests.config', log_path=log_path)
+    assert restarted.get('log.level', 'flags.new_ui', 'name') == ('INFO', False, 'logged')
+    assert restarted.version == 0
+    restarted.reload()
+    assert restarted.get('log.level') == 'INFO'
+
+    # Torn records are truncated and records no longer valid are dropped.
+    with open(log_path, 'a') as infile:
+        infile.write('[1,[["missing.prop",1]]]\n[1,[["log.level","ERR')
+    monkeypatch.setattr(configaro, 'LOG_COMPACT_RECORDS', 3)
+    restarted = Config()
+    restarted.init('tests.config', log_path=log_path)
+    assert restarted.get('log.level') == 'INFO'
+    with open(log_path) as infile:
+        assert [line.split(',')[1] for line in infile] == ['[["log.level"', '[["flags"', '[["flags.new_ui"', '[["name"']
+    for level in ['A', 'B', 'C', 'D']:
+        restarted.put(f'log.level={level}')
+    restarted._log.sync()
+    with open(log_path) as infile:
+        assert len(infile.readlines()) <= 5
+    restarted = Config()
+    restarted.init('tests.config', log_path=log_path)
+    assert restarted.get('log.level', 'flags.new_ui') == ('D', False)
+
+    # Puts made while reloading are neither lost nor truncated.
+    thread = threading.Thread(target=lambda: [restarted.put(f'name=put-{i}') for i in range(100)])
+    thread.start()
+    for _ in range(5):
+        restarted.reload()
+    thread.join()
+    assert restarted.get('name') == 'put-99'
+    restarted.reload()
+    assert restarted.get('name') == 'put-99'
+    restarted._log.sync()
+    restarted = Config()
+    restarted.init('tests.config', log_path=log_path)
+    assert restarted.get('name') == 'put-99'
+
+
+def test_TraceRecorder():
+    import io
+    import json
+    from configaro import Config, Tracer, TraceRecorder, set_tracer
+    recorder = TraceRecorder()
+    previous = set_tracer(recorder)
+    try:
+        config = Config()
+        config.init('tests.config')
+        config.reload()
+    finally:
+        assert set_tracer(previous) is recorder
+    assert isinstance(previous, Tracer)
+    events = recorder.to_chrome_trace()['traceEvents']
+    names = [event['name'] for event in events]
+    assert names.count('build') == 2
+    assert {'package_dir', 'find', 'load', 'merge', 'interpolate'} <= set(names)
+    build = events[names.index('build')]
+    for event in events[:names.index('build')]:
+        assert event['ph'] == 'X'
+        assert build['ts'] <= event['ts'] and event['ts'] + event['dur'] <= build['ts'] + build['dur']
+    merge = events[names.index('merge')]
+    assert merge['args'] == {'configs': 2, 'values': 5}
+    outfile = io.StringIO()
+    recorder.dump(outfile)
+    assert json.loads(outfile.getvalue())['traceEvents'][0]['name'] == names[0]
+
+
+def test_export_blob(tmp_path):
+    from configaro import Config, ConfigModuleNotValidError, ConfigObjectNotInitializedError, FileValue
+    config = Config()
+    with pytest.raises(ConfigObjectNotInitializedError):
+        config.export_blob()
+    config.init('tests.config')
+    config.put({'paths': {'root': '/srv', 'logs': '${paths.root}/logs'}})
+    config.put('log.level=INFO')
+    blob = config.export_blob()
+    assert blob.startswith(b'CFGBLOBM')
+
+    adopted = Config()
+    adopted.adopt_blob(blob)
+    assert adopted.get() == config.get()
+    adopted.adopt_blob(b'ignored once initialized')
+    adopted.put('paths.root=/opt')
+    assert adopted.get('paths.logs') == '/opt/logs'
+    assert config.get('paths.logs') == '/srv/logs'
+    adopted.reload()
+    assert adopted.get('log.level') == 'DEBUG'
+
+    cert_path = tmp_path / 'cert.pem'
+    cert_path.write_text('CERT')
+    config.put({'cert': FileValue(str(cert_path))})
+    blob = config.export_blob()
+    assert blob.startswith(b'CFGBLOBP')
+    adopted = Config()
+    adopted.adopt_blob(blob)
+    assert adopted.get('cert') == 'CERT'
+    with pytest.raises(ConfigModuleNotValidError):
+        Config().adopt_blob(b'not a blob')
+
+
+def test_footprint():
+    import sys
+    from configaro import Config, ConfigFootprint
+    config = Config()
+    config.init('tests.config')
+    name = 'a' * 100
+    shared = {'owner': f'team-{name}'}
+    config.put({'teams': {'a': shared, 'b': shared, 'c': {'owner': f'team-{name}'}}})
+    reports = config.footprint()
+    assert all(isinstance(report, ConfigFootprint) for report in reports)
+    assert reports[0].prop_name == 'teams'
+    assert [report.size for report in reports] == sorted((report.size for report in reports), reverse=True)
+    assert sorted(report.prop_name for report in reports) == ['log', 'monitoring', 'name', 'teams']
+    teams = {report.prop_name: report for report in config.footprint('teams')}
+    assert (teams['teams.a'].nodes, teams['teams.a'].leaves, teams['teams.a'].duplicates) == (1, 1, 0)
+    assert teams['teams.a'].size > sys.getsizeof(shared['owner'])
+    assert teams['teams.b'].size == 0
+    assert teams['teams.c'].duplicates == 1
+    leaf, = config.footprint('teams.c.owner')
+    assert (leaf.prop_name, leaf.nodes, leaf.leaves) == ('teams.c.owner', 0, 1)
+    assert repr(leaf).startswith("ConfigFootprint('teams.c.owner', size=")
+
+
+def test_serve(tmp_path, monkeypatch):
+    import socket
+    import time
+    import configaro
+    from configaro import (Config, ConfigClient, ConfigPropertyNotFoundError, ConfigPropertyNotScalarError,
+                           _recv_frame, _send_frame, serve)
+    config = Config()
+    config.init('tests.config')
+    path = str(tmp_path / 'config.sock')
+    with serve(path, config) as server, ConfigClient(path, pool_size=2) as client:
+        assert server.config is config
+        assert client.get('log.level') == 'DEBUG'
+        assert client.get('log.level', 'name') == ('DEBUG', 'locals')
+        assert client.get('log') == {'file': 'some-file.txt', 'level': 'DEBUG'}
+        assert client.get('flags.x', default=False) is False
+        with pytest.raises(ConfigPropertyNotFoundError):
+            client.get('flags.x')
+        assert client.get() == munch.unmunchify(config.get())
+        assert 'log.level' in client._cache
+
+        # Changes made by the client or the server are seen by the client.
+        client.put('log.level=INFO')
+        assert config.get('log.level') == 'INFO'
+        assert client.get('log.level') == 'INFO'
+        config.put('log.file=other.txt')
+        for _ in range(100):
+            if 'log' not in client._cache:
+                break
+            time.sleep(0.01)
+        assert client.get('log.file') == 'other.txt'
+        with pytest.raises(ConfigPropertyNotScalarError):
+            client.put('log=INFO')
+        assert len(client._pool) <= 2
+
+        # The cache keeps the most recently used config values and misses.
+        monkeypatch.setattr(configaro, 'CLIENT_CACHE_SIZE', 2)
+        client.get('log.level', 'flags.y', default=None)
+        client.get('name')
+        client.get('log.level')
+        assert list(client._cache) == ['name', 'log.level']
+
+        with ConfigClient(path, cache=False) as watcher:
+            changes = watcher.watch()
+            config.put('name=watched')
+            change = next(changes)
+            assert (change.version, change.prop_name, change.old_value, change.new_value) == (
+                config.version, 'name', 'locals', 'watched')
+            changes.close()
+
+        # Requests that are not valid are responded to, keeping the connection.
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(path)
+            for request in [{'op': 'get'}, {'op': 'get', 'names': [1]}, {'op': 'put', 'args': [1]},
+                            {'op': 'put', 'kwargs': []}, {'op': 'nope'}, []]:
+                _send_frame(connection, request)
+                assert _recv_frame(connection)['error']['message'].startswith('config request not valid: ')
+            connection.sendall(b'\x00\x00\x00\x01{')
+            assert _recv_frame(connection)['error']['type'] == 'ConfigError'
+            _send_frame(connection, {'op': 'get', 'names': ['name']})
+            assert _recv_frame(connection)['values'] == ['watched']
+    assert not os.path.exists(path)
+
+
 def test_ConfigaroError():
     from configaro import ConfigError
     message = 'this is an error'
@@ -229,6 +984,7 @@ def test_ConfigNotValidError():
 
 
 def test_PropertyNotFoundError():
+    import gc
     from configaro import ConfigError, ConfigPropertyNotFoundError
     data = None
     prop_name = 'prop.inner'
@@ -240,6 +996,12 @@ def test_PropertyNotFoundError():
     error = ConfigPropertyNotFoundError(prop_name=prop_name, data=data)
     assert error.data == data
     assert error.prop_name == prop_name
+    data = munch.munchify(SAMPLE_DATA)
+    error = ConfigPropertyNotFoundError(data, prop_name)
+    assert error.data == SAMPLE_DATA
+    del data
+    gc.collect()
+    assert error.data is None
 
 
 def test_PropertyNotScalarError():
@@ -256,6 +1018,14 @@ def test_PropertyNotScalarError():
     assert error.prop_name == prop_name
 
 
+def test_VersionNotAvailableError():
+    from configaro import ConfigError, ConfigVersionNotAvailableError
+    error = ConfigVersionNotAvailableError(3)
+    assert isinstance(error, ConfigError)
+    assert error.message == 'config version not available: 3'
+    assert error.version == 3
+
+
 def test_UpdateNotValidError():
     from configaro import ConfigError, ConfigUpdateNotValidError
     update = 'prop=value'
@@ -265,3 +1035,163 @@ def test_UpdateNotValidError():
     assert error.update == update
     error = ConfigUpdateNotValidError(update=update)
     assert error.update == update
+
+
+def test_watch():
+    import asyncio
+    import gc
+    import threading
+    from configaro import Config
+
+    async def main():
+        config = Config()
+        await config.init_async('tests.config')
+        assert config.get('log.level') == 'DEBUG'
+        changes = config.watch()
+        config.put('log.level=INFO')
+        thread = threading.Thread(target=config.put, args=('name=threaded',))
+        thread.start()
+        thread.join()
+        first = await changes.__anext__()
+        assert (first.prop_name, first.old_value, first.new_value) == ('log.level', 'DEBUG', 'INFO')
+        second = await changes.__anext__()
+        assert (second.prop_name, second.new_value) == ('name', 'threaded')
+        await config.reload_async()
+        names = set()
+        async for change in changes:
+            names.add(change.prop_name)
+            if names == {'log.level', 'name'}:
+                break
+        await changes.aclose()
+        assert config.get('log.level') == 'DEBUG'
+        assert not config._listeners
+        with pytest.raises(StopAsyncIteration):
+            await changes.__anext__()
+        config.watch()
+        gc.collect()
+        assert not config._listeners
+
+    asyncio.run(main())
+
+
+def test_freeze():
+    import gc
+    from configaro import Config, ConfigObjectNotInitializedError
+    config = Config()
+    with pytest.raises(ConfigObjectNotInitializedError):
+        config.freeze()
+    config.init('tests.config')
+    name = 'a' * 100
+    config.put({'teams': {'a': {'owner': f'team-{name}'}, 'b': {'owner': f'team-{name}'}}})
+    expected = config.get()
+    assert config.footprint('teams')[1].duplicates == 1
+    try:
+        Config(base=config).freeze()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+    assert config.get() == expected
+    assert sum(report.duplicates for report in config.footprint('teams')) == 0
+    config.put('teams.a.owner=nobody')
+    assert config.get('teams.a.owner') == 'nobody'
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_fork():
+    from configaro import Config
+    config = Config()
+    config.init('tests.config')
+    config.put('log.level=INFO')
+    changes = []
+    config._listen(changes.append)
+    with config._lock:
+        pid = os.fork()
+        if pid == 0:
+            # The lock held by the parent must not be held in the child.
+            try:
+                config.put('log.level=WARNING')
+                os._exit(0 if config.get('log.level') == 'WARNING' and not changes else 1)
+            finally:
+                os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert config.get('log.level') == 'INFO'
+
+
+def test_get_columns():
+    from array import array
+    from configaro import Config, ConfigPropertyNotColumnarError
+    config = Config()
+    config.init('tests.config')
+    config.put({'backends': [{'host': 'a', 'port': 80, 'weight': 0.5}, {'host': 'b', 'port': 81, 'weight': 1}]})
+    config.put({'tiers': [10, 100, 1000]})
+    backends = config.get_columns('backends')
+    assert backends == {'host': ('a', 'b'), 'port': array('q', [80, 81]), 'weight': array('d', [0.5, 1.0])}
+    assert config.get_columns('backends') is backends
+    assert config.get_columns('tiers') == array('q', [10, 100, 1000])
+    config.put({'tiers': [10, 100, 1000.5]})
+    assert config.get_columns('tiers') == array('d', [10, 100, 1000.5])
+    assert config.get_columns('backends') is not backends
+    tenant = Config(base=config)
+    tenant.put({'tiers': [1, 2]})
+    assert tenant.get_columns('tiers') == array('q', [1, 2])
+    assert config.get_columns('tiers') == array('d', [10, 100, 1000.5])
+    for value in ([], ['a', 'b'], [{'a': 1}, {'b': 2}], [{'a': 1}, 2], {'a': 1}):
+        config.put({'bad': value})
+        with pytest.raises(ConfigPropertyNotColumnarError) as excinfo:
+            config.get_columns('bad')
+        assert excinfo.value.message == 'config property not columnar: bad'
+
+
+def test_get_columns_numpy():
+    np = pytest.importorskip('numpy')
+    from configaro import Config
+    config = Config()
+    config.init('tests.config')
+    config.put({'backends': [{'host': 'a', 'weight': 0.5}, {'host': 'b', 'weight': 1.5}]})
+    backends = config.get_columns('backends', numpy=True)
+    assert backends['weight'].dtype == np.float64 and backends['weight'].sum() == 2.0
+    assert list(backends['host']) == ['a', 'b']
+    assert not backends['weight'].flags.writeable
+
+
+def test_add_put_argument(capsys):
+    from argparse import ArgumentParser
+    from configaro import Config, ConfigPropertyNotFoundError, add_put_argument
+    parser = ArgumentParser(prog='job')
+    action = add_put_argument(parser)
+    assert action.dest == 'set'
+    assert parser.parse_args([]).set == []
+    args = parser.parse_args(['--set', 'log.level=INFO', '--set', 'log.file=job.log', '--set', 'name=job'])
+    config = Config()
+    config.init('tests.config')
+    version = config.version
+    config.put(*args.set)
+    assert config.version == version + 1
+    assert config.get('log') == {'file': 'job.log', 'level': 'INFO'}
+    assert config.get('name') == 'job'
+    with pytest.raises(ConfigPropertyNotFoundError) as excinfo:
+        config.put('log.level=ERROR', 'log.levle=ERROR')
+    assert excinfo.value.message == 'config property not found: log.levle'
+    assert config.get('log.level') == 'INFO'
+    assert config.version == version + 1
+    tenant = Config(base=config)
+    with pytest.raises(ConfigPropertyNotFoundError):
+        tenant.put('name=tenant', 'log.levle=ERROR')
+    assert tenant.get('name') == 'job'
+    config.put_arguments(parser, ['log.level=WARNING', 'name=other'])
+    assert config.get('log.level') == 'WARNING'
+    for updates, message in ((['name=a', 'log.nope=1'], 'argument --set #2: log.nope=1: config property not found'),
+                             (['name=a', 'a=1 b=2'], 'argument --set #2: config update not valid: a=1 b=2')):
+        with pytest.raises(SystemExit):
+            config.put_arguments(parser, updates)
+        assert message in capsys.readouterr().err
+        assert config.get('name') == 'other'
+    for arg in ('log.level', 'log.level=INFO name=job'):
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--set', 'name=job', '--set', arg])
+        assert f'argument --set: config update not valid: {arg}' in capsys.readouterr().err
+
+    parser = ArgumentParser()
+    add_put_argument(parser, '-o', '--override', dest='overrides')
+    assert parser.parse_args(['-o', 'name=a']).overrides == ['name=a']